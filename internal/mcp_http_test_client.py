@@ -24,13 +24,149 @@ Environment Variables:
 """
 
 import argparse
+import itertools
 import json
 import os
+import socket
 import sys
+import tempfile
 import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from pathlib import Path
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None
+
+INITIALIZE_PARAMS: dict[str, Any] = {
+    "protocolVersion": "2024-11-05",
+    "clientInfo": {"name": "mcp-http-test-client", "version": "1.0.0"},
+    "capabilities": {},
+}
+
+# Small per-user cache shared by back-to-back CLI invocations.
+CACHE_DIR = Path(os.path.expanduser("~/.cache/ploston"))
+
+# A /health success younger than this is trusted without re-probing.
+HEALTH_TTL_SECONDS = 2.0
+
+# Bodies at or below this size are read in one go; larger ones are streamed.
+STREAM_THRESHOLD = 65536
+
+# How long a cached initialize result stands in for a fresh handshake.
+INIT_TTL_SECONDS = 300.0
+
+# How long a server's rejection of JSON-RPC batches is remembered.
+BATCH_REJECT_TTL_SECONDS = 86400.0
+
+
+def json_dumps(data: Any) -> bytes:
+    """Serialize data to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def json_loads(data: bytes | str) -> Any:
+    """Parse JSON text or bytes.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+    catch the stdlib exception for both implementations.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def resolve_host(host: str, port: int) -> str:
+    """Resolve host to an IPv4 address once, up front.
+
+    Only IPv4 is pinned, matching socket.gethostbyname: pinning the first
+    getaddrinfo answer could pick ::1 for "localhost" and miss a server bound
+    to 127.0.0.1 only. Names without an IPv4 address, and IPv6 literals,
+    keep their original form so urllib3 still tries every address; so does
+    a name that cannot be resolved, leaving the error to the first request.
+    """
+    if ":" in host:
+        return host if host.startswith("[") else f"[{host}]"
+    try:
+        return socket.getaddrinfo(host, port, socket.AF_INET, socket.SOCK_STREAM)[0][4][0]
+    except (OSError, IndexError):
+        return host
+
+
+def read_body(response: requests.Response) -> bytes | bytearray:
+    """Read a streamed response body.
+
+    Large bodies are accumulated chunk by chunk into one bytearray rather
+    than joined from a list of chunks, keeping only one copy in memory.
+    """
+    length = response.headers.get("Content-Length")
+    if length is not None and int(length) <= STREAM_THRESHOLD:
+        return response.content
+    body = bytearray()
+    for chunk in response.iter_content(STREAM_THRESHOLD):
+        body.extend(chunk)
+    return body
+
+
+def read_cache(name: str) -> dict[str, Any]:
+    """Read a JSON cache file, returning {} if it is missing or unreadable."""
+    try:
+        data = json_loads((CACHE_DIR / name).read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def write_cache(name: str, data: dict[str, Any]) -> None:
+    """Atomically replace a JSON cache file. Failures are ignored."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, prefix=f".{name}.")
+        with os.fdopen(fd, "wb") as f:
+            f.write(json_dumps(data))
+        os.replace(tmp, CACHE_DIR / name)
+    except OSError:
+        pass
+
+
+def result_from_response(response: dict[str, Any]) -> dict[str, Any]:
+    """Return the result of a JSON-RPC response, raising on error."""
+    if "error" in response:
+        raise RuntimeError(f"Error: {response['error']}")
+    return response.get("result", {})
+
+
+def tools_from_response(response: dict[str, Any]) -> list[dict[str, Any]]:
+    """Return the tool list from a tools/list response, raising on error."""
+    return result_from_response(response).get("tools", [])
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose sockets set TCP_NODELAY and SO_KEEPALIVE.
+
+    urllib3's defaults already disable Nagle's algorithm (TCP_NODELAY) so
+    small JSON-RPC requests go out immediately; SO_KEEPALIVE is added so
+    idle pooled connections are probed rather than silently dropped.
+    """
+
+    SOCKET_OPTIONS = [
+        *HTTPConnection.default_socket_options,
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs["socket_options"] = self.SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
 
 
 class MCPHTTPTestClient:
@@ -40,16 +176,51 @@ class MCPHTTPTestClient:
         self,
         host: str = "127.0.0.1",
         port: int = 8022,
+        max_connections: int = 8,
+        debug: bool = False,
+        batch: bool = False,
     ):
+        # Accept "[::1]" as well as "::1"; the bare form is bracketed again
+        # for both the URL and the Host header.
+        if host.startswith("[") and host.endswith("]"):
+            host = host[1:-1]
         self.host = host
         self.port = port
-        self.base_url = f"http://{host}:{port}"
-        self._msg_id = 0
-        self._session_id: str | None = None
+        self.base_url = f"http://{resolve_host(host, port)}:{port}"
+        # next() on a count is atomic under the GIL, so fan-out threads can
+        # share it without a lock.
+        self._id_gen = itertools.count(1)
+        self.debug = debug
+        # Ploston's /mcp rejects JSON-RPC batches, so send_initialized only
+        # batches when asked to.
+        self.batch = batch
+        self._batch_supported: bool | None = None  # unknown until cache is read
+        self._cache_key = f"{host}:{port}"
+        self._last_ok_ts: float | None = None
+        self._sorted_tools: list[dict[str, Any]] | None = None
+
+        # One keep-alive session for every call so list/call/ping reuse the
+        # same TCP connection instead of paying a handshake per request.
+        self._session = requests.Session()
+        # base_url may carry a resolved address; keep the original name in Host.
+        host_header = f"[{host}]:{port}" if ":" in host else f"{host}:{port}"
+        self._session.headers.update({"Content-Type": "application/json", "Host": host_header})
+        self._session.mount(
+            "http://",
+            KeepAliveAdapter(
+                pool_connections=2,
+                pool_maxsize=max_connections,
+                pool_block=False,
+                max_retries=0,
+            ),
+        )
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
 
     def _next_id(self) -> int:
-        self._msg_id += 1
-        return self._msg_id
+        return next(self._id_gen)
 
     def wait_for_server(self, timeout: int = 30) -> bool:
         """Wait for the HTTP server to be ready.
@@ -57,79 +228,240 @@ class MCPHTTPTestClient:
         Returns:
             True if server is ready, False if timeout.
         """
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        if self._recently_alive():
+            return True
+
+        # Back off exponentially from 10ms so a server that is already up is
+        # detected after one round trip instead of a fixed 0.5s sleep.
+        delay = 0.01
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
             try:
-                response = requests.get(f"{self.base_url}/health", timeout=1)
+                response = self._session.get(f"{self.base_url}/health", timeout=(0.2, 1.0))
                 if response.status_code == 200:
+                    self._mark_alive()
                     print(f"[CLIENT] Server ready at {self.base_url}", file=sys.stderr)
                     return True
-            except requests.exceptions.ConnectionError:
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
                 pass
-            time.sleep(0.5)
+            time.sleep(delay)
+            delay = min(delay * 1.6, 0.5)
         return False
 
     def is_server_running(self) -> bool:
         """Check if the server is running."""
+        if self._recently_alive():
+            return True
         try:
-            response = requests.get(f"{self.base_url}/health", timeout=2)
-            return response.status_code == 200
+            response = self._session.get(f"{self.base_url}/health", timeout=2)
         except requests.exceptions.ConnectionError:
             return False
+        if response.status_code != 200:
+            return False
+        self._mark_alive()
+        return True
 
-    def send(self, method: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
-        """Send a JSON-RPC request via HTTP."""
-        msg_id = self._next_id()
-        request = {
+    def _recently_alive(self) -> bool:
+        """Return True if /health succeeded within HEALTH_TTL_SECONDS.
+
+        Checks this process first, then the timestamp left by a previous run.
+        """
+        if self._last_ok_ts is not None:
+            return time.monotonic() - self._last_ok_ts < HEALTH_TTL_SECONDS
+        return self._health_cache_fresh(read_cache("health.json"))
+
+    def _health_cache_fresh(self, health: dict[str, Any]) -> bool:
+        last_ok = health.get(self._cache_key)
+        return isinstance(last_ok, (int, float)) and 0 <= time.time() - last_ok < HEALTH_TTL_SECONDS
+
+    def _mark_alive(self) -> None:
+        self._last_ok_ts = time.monotonic()
+        # Rewrite the shared file only once the stored timestamp has expired.
+        health = read_cache("health.json")
+        if self._health_cache_fresh(health):
+            return
+        health[self._cache_key] = time.time()
+        write_cache("health.json", health)
+
+    def _build_request(self, method: str, params: dict[str, Any] | None) -> dict[str, Any]:
+        request: dict[str, Any] = {
             "jsonrpc": "2.0",
-            "id": msg_id,
+            "id": self._next_id(),
             "method": method,
         }
         if params:
             request["params"] = params
+        return request
 
-        headers = {"Content-Type": "application/json"}
-        if self._session_id:
-            headers["X-MCP-Session-ID"] = self._session_id
+    def send(self, method: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Send a JSON-RPC request via HTTP."""
+        request = self._build_request(method, params)
+        msg_id = request["id"]
 
-        print(f"[CLIENT] >>> {method}", file=sys.stderr)
+        if self.debug:
+            print(f"[CLIENT] >>> {method}", file=sys.stderr)
 
-        response = requests.post(
+        with self._session.post(
             f"{self.base_url}/mcp",
-            json=request,
-            headers=headers,
-            timeout=60,
-        )
+            data=json_dumps(request),
+            timeout=(3, 60),
+            stream=True,
+        ) as response:
+            if self.debug:
+                self._log_response(method, response)
+            if response.status_code == 204:
+                return {"jsonrpc": "2.0", "id": msg_id, "result": None}
+
+            return json_loads(read_body(response))
+
+    @staticmethod
+    def _log_response(method: str, response: requests.Response) -> None:
+        # With stream=True the connection is still attached here, so the fd
+        # shows whether keep-alive reused the socket across requests.
+        conn = getattr(response.raw, "connection", None)
+        sock = getattr(conn, "sock", None)
+        fd = sock.fileno() if sock is not None else "?"
+        print(f"[CLIENT] <<< {method} {response.status_code} (fd {fd})", file=sys.stderr)
+
+    def send_batch(self, calls: list[tuple[str, dict[str, Any] | None]]) -> list[dict[str, Any]]:
+        """Send several JSON-RPC requests in a single HTTP POST.
+
+        Responses are matched back to requests by id and returned in the
+        order of ``calls``. If the server does not answer with a JSON-RPC
+        batch, the calls are retried one request at a time, and the rejection
+        is cached so later runs skip the batch attempt.
+        """
+        if self._batch_supported is None:
+            rejected_at = read_cache("mcp-batch.json").get(self._cache_key)
+            self._batch_supported = not (
+                isinstance(rejected_at, (int, float))
+                and 0 <= time.time() - rejected_at < BATCH_REJECT_TTL_SECONDS
+            )
+        if not self._batch_supported:
+            return [self.send(method, params) for method, params in calls]
 
-        if response.status_code == 204:
-            return {"jsonrpc": "2.0", "id": msg_id, "result": None}
+        batch = [self._build_request(method, params) for method, params in calls]
 
-        return response.json()
+        if self.debug:
+            print(f"[CLIENT] >>> batch({', '.join(m for m, _ in calls)})", file=sys.stderr)
+
+        with self._session.post(
+            f"{self.base_url}/mcp",
+            data=json_dumps(batch),
+            timeout=(3, 60),
+            stream=True,
+        ) as response:
+            try:
+                body = [] if response.status_code == 204 else json_loads(read_body(response))
+            except ValueError:
+                body = None
+        if not isinstance(body, list):
+            print("[CLIENT] Batch not supported, sending calls individually", file=sys.stderr)
+            self._batch_supported = False
+            rejected = read_cache("mcp-batch.json")
+            rejected[self._cache_key] = time.time()
+            write_cache("mcp-batch.json", rejected)
+            # The server may drop the connection after rejecting the batch;
+            # discard pooled connections so the fallback starts clean.
+            self._session.close()
+            return [self.send(method, params) for method, params in calls]
+
+        by_id = {r.get("id"): r for r in body}
+        return [
+            by_id.get(req["id"], {"jsonrpc": "2.0", "id": req["id"], "result": None})
+            for req in batch
+        ]
 
     def initialize(self) -> dict[str, Any]:
         """Send initialize request."""
-        return self.send(
-            "initialize",
-            {
-                "protocolVersion": "2024-11-05",
-                "clientInfo": {"name": "mcp-http-test-client", "version": "1.0.0"},
-                "capabilities": {},
-            },
+        response = self.send("initialize", INITIALIZE_PARAMS)
+        self._remember_init(response)
+        return response
+
+    def send_initialized(
+        self, method: str, params: dict[str, Any] | None = None
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Send a request preceded by initialize, unless a recent init is cached.
+
+        With ``batch`` set, initialize and the request share one POST.
+
+        Returns:
+            The (initialize, method) responses. On a cache hit the initialize
+            response is rebuilt from the cache and only one request is sent.
+        """
+        cached = self.cached_initialize()
+        if cached is not None:
+            return cached, self.send(method, params)
+
+        if not self.batch:
+            return self.initialize(), self.send(method, params)
+
+        init_response, response = self.send_batch(
+            [("initialize", INITIALIZE_PARAMS), (method, params)]
         )
+        self._remember_init(init_response)
+        return init_response, response
+
+    def cached_initialize(self) -> dict[str, Any] | None:
+        """Return an initialize response rebuilt from a recent cache entry, if any."""
+        cached = read_cache("mcp-init.json").get(self._cache_key)
+        if not isinstance(cached, dict):
+            return None
+        ts = cached.get("ts")
+        if (
+            cached.get("protocolVersion") == INITIALIZE_PARAMS["protocolVersion"]
+            and isinstance(ts, (int, float))
+            and 0 <= time.time() - ts < INIT_TTL_SECONDS
+        ):
+            result = {k: v for k, v in cached.items() if k != "ts"}
+            return {"jsonrpc": "2.0", "id": None, "result": result}
+        return None
+
+    def _remember_init(self, response: dict[str, Any]) -> None:
+        result = response.get("result")
+        if not isinstance(result, dict) or "protocolVersion" not in result:
+            return
+        cache = read_cache("mcp-init.json")
+        cache[self._cache_key] = {
+            "ts": time.time(),
+            "protocolVersion": result["protocolVersion"],
+            "serverInfo": result.get("serverInfo", {}),
+            "capabilities": result.get("capabilities", {}),
+        }
+        write_cache("mcp-init.json", cache)
 
     def list_tools(self) -> list[dict[str, Any]]:
         """List available tools."""
-        response = self.send("tools/list", {})
-        if "error" in response:
-            raise RuntimeError(f"Error: {response['error']}")
-        return response.get("result", {}).get("tools", [])
+        return tools_from_response(self.send("tools/list", {}))
+
+    def sorted_tools(self) -> list[dict[str, Any]]:
+        """List available tools sorted by name, reusing the last listing.
+
+        The cache is dropped on call_tool, since a tool call (e.g. a workflow
+        publish) can change what the server exposes.
+        """
+        if self._sorted_tools is None:
+            self._sorted_tools = sorted(self.list_tools(), key=itemgetter("name"))
+        return self._sorted_tools
 
     def call_tool(self, name: str, arguments: dict[str, Any]) -> dict[str, Any]:
         """Call a tool."""
-        response = self.send("tools/call", {"name": name, "arguments": arguments})
-        if "error" in response:
-            raise RuntimeError(f"Error: {response['error']}")
-        return response.get("result", {})
+        self._sorted_tools = None
+        return result_from_response(self.send("tools/call", {"name": name, "arguments": arguments}))
+
+    def call_tools(
+        self, calls: list[tuple[str, dict[str, Any]]], parallel: int = 1
+    ) -> list[dict[str, Any]]:
+        """Call several tools with up to ``parallel`` requests in flight.
+
+        Results are returned in the order of ``calls``. Size the client's
+        ``max_connections`` to at least ``parallel`` so every worker gets a
+        pooled connection.
+        """
+        if parallel <= 1 or len(calls) <= 1:
+            return [self.call_tool(name, arguments) for name, arguments in calls]
+        with ThreadPoolExecutor(max_workers=min(parallel, len(calls))) as pool:
+            return list(pool.map(lambda call: self.call_tool(*call), calls))
 
     def ping(self) -> bool:
         """Ping the server."""
@@ -137,9 +469,125 @@ class MCPHTTPTestClient:
         return response.get("result", {}).get("pong", False)
 
 
-def print_json(data: Any, indent: int = 2) -> None:
-    """Pretty print JSON data."""
-    print(json.dumps(data, indent=indent))
+def format_tool_table(tools: list[dict[str, Any]], desc_width: int) -> str:
+    """Format tools as name/description rows, built as one string for one write."""
+    return "".join(f"  {t['name']:<40} {t.get('description', '')[:desc_width]}\n" for t in tools)
+
+
+def print_json(data: Any, pretty: bool = False) -> None:
+    """Print JSON data, compact unless ``pretty`` is set."""
+    if orjson is None:
+        # json.dump streams chunks to stdout instead of building one large str.
+        if pretty:
+            json.dump(data, sys.stdout, indent=2)
+        else:
+            json.dump(data, sys.stdout, separators=(",", ":"))
+        sys.stdout.write("\n")
+        return
+    option = orjson.OPT_APPEND_NEWLINE | (orjson.OPT_INDENT_2 if pretty else 0)
+    # Flush pending text output so it is not reordered after the raw bytes.
+    sys.stdout.flush()
+    sys.stdout.buffer.write(orjson.dumps(data, option=option))
+
+
+def _cmd_init(client: MCPHTTPTestClient, parts: list[str]) -> None:
+    print_json(client.initialize(), pretty=True)
+
+
+def _cmd_list(client: MCPHTTPTestClient, parts: list[str]) -> None:
+    tools = client.sorted_tools()
+    sys.stdout.write(f"\nFound {len(tools)} tools:\n\n{format_tool_table(tools, 40)}\n")
+
+
+def _cmd_call(client: MCPHTTPTestClient, parts: list[str]) -> None:
+    if len(parts) < 2:
+        print("Usage: call <tool> [json_args]")
+        return
+    args = json_loads(parts[2]) if len(parts) > 2 else {}
+    print_json(client.call_tool(parts[1], args), pretty=True)
+
+
+def _cmd_workflow(client: MCPHTTPTestClient, parts: list[str]) -> None:
+    if len(parts) < 2:
+        print("Usage: workflow <name> [inputs]")
+        return
+    inputs = json_loads(parts[2]) if len(parts) > 2 else {}
+    print_json(client.call_tool(f"workflow:{parts[1]}", inputs), pretty=True)
+
+
+def _cmd_ping(client: MCPHTTPTestClient, parts: list[str]) -> None:
+    print(f"Pong: {client.ping()}")
+
+
+def _cmd_raw(client: MCPHTTPTestClient, parts: list[str]) -> None:
+    if len(parts) < 2:
+        print("Usage: raw <method> [json_params]")
+        return
+    params = json_loads(parts[2]) if len(parts) > 2 else None
+    print_json(client.send(parts[1], params), pretty=True)
+
+
+def _cmd_batch(client: MCPHTTPTestClient, parts: list[str]) -> None:
+    calls = []
+    while True:
+        batch_line = input("  ...> ").strip()
+        if not batch_line:
+            break
+        batch_parts = batch_line.split(maxsplit=1)
+        batch_params = json_loads(batch_parts[1]) if len(batch_parts) > 1 else None
+        calls.append((batch_parts[0], batch_params))
+    if calls:
+        print_json(client.send_batch(calls), pretty=True)
+
+
+def _cmd_help(client: MCPHTTPTestClient, parts: list[str]) -> None:
+    print(f"Commands: {', '.join(COMMANDS)}, quit")
+
+
+def _cmd_unknown(client: MCPHTTPTestClient, parts: list[str]) -> None:
+    print(f"Unknown command: {parts[0].lower()}. Type 'help' for commands.")
+
+
+COMMANDS: dict[str, Callable[[MCPHTTPTestClient, list[str]], None]] = {
+    "init": _cmd_init,
+    "list": _cmd_list,
+    "call": _cmd_call,
+    "workflow": _cmd_workflow,
+    "ping": _cmd_ping,
+    "raw": _cmd_raw,
+    "batch": _cmd_batch,
+    "help": _cmd_help,
+}
+
+QUIT_COMMANDS = frozenset({"quit", "exit", "q"})
+
+
+def _enable_completion(client: MCPHTTPTestClient) -> None:
+    """Tab-complete command names, and tool names after 'call'.
+
+    Tool names come only from an already cached listing, so completing
+    never sends a request. A no-op where readline is unavailable.
+    """
+    try:
+        import readline
+    except ImportError:
+        return
+
+    words = sorted([*COMMANDS, *QUIT_COMMANDS])
+
+    def complete(text: str, state: int) -> str | None:
+        head = readline.get_line_buffer()[: readline.get_begidx()].split()
+        if not head:
+            candidates = words
+        elif head == ["call"] and client._sorted_tools is not None:
+            candidates = [t["name"] for t in client._sorted_tools]
+        else:
+            return None
+        matches = [w for w in candidates if w.startswith(text)]
+        return matches[state] if state < len(matches) else None
+
+    readline.set_completer(complete)
+    readline.parse_and_bind("tab: complete")
 
 
 def interactive_mode(client: MCPHTTPTestClient) -> None:
@@ -152,9 +600,14 @@ def interactive_mode(client: MCPHTTPTestClient) -> None:
     print("  workflow <name> [inputs]  - Run a workflow")
     print("  ping                      - Ping server")
     print("  raw <method> [json_params] - Send raw JSON-RPC")
+    print("  batch                     - Send several raw requests in one POST")
+    print("                              (one '<method> [json_params]' per line,")
+    print("                              blank line to send)")
     print("  quit                      - Exit")
     print()
 
+    _enable_completion(client)
+
     while True:
         try:
             line = input("mcp-http> ").strip()
@@ -167,38 +620,11 @@ def interactive_mode(client: MCPHTTPTestClient) -> None:
 
         parts = line.split(maxsplit=2)
         cmd = parts[0].lower()
+        if cmd in QUIT_COMMANDS:
+            break
 
         try:
-            if cmd in ("quit", "exit", "q"):
-                break
-            elif cmd == "init":
-                print_json(client.initialize())
-            elif cmd == "list":
-                tools = client.list_tools()
-                print(f"\nFound {len(tools)} tools:\n")
-                for t in sorted(tools, key=lambda x: x["name"]):
-                    print(f"  {t['name']:<40} {t.get('description', '')[:40]}")
-                print()
-            elif cmd == "call" and len(parts) >= 2:
-                tool_name = parts[1]
-                args = json.loads(parts[2]) if len(parts) > 2 else {}
-                result = client.call_tool(tool_name, args)
-                print_json(result)
-            elif cmd == "workflow" and len(parts) >= 2:
-                workflow_name = parts[1]
-                inputs = json.loads(parts[2]) if len(parts) > 2 else {}
-                result = client.call_tool(f"workflow:{workflow_name}", inputs)
-                print_json(result)
-            elif cmd == "ping":
-                print(f"Pong: {client.ping()}")
-            elif cmd == "raw" and len(parts) >= 2:
-                method = parts[1]
-                params = json.loads(parts[2]) if len(parts) > 2 else None
-                print_json(client.send(method, params))
-            elif cmd == "help":
-                print("Commands: init, list, call, workflow, ping, raw, quit")
-            else:
-                print(f"Unknown command: {cmd}. Type 'help' for commands.")
+            COMMANDS.get(cmd, _cmd_unknown)(client, parts)
         except json.JSONDecodeError as e:
             print(f"Invalid JSON: {e}", file=sys.stderr)
         except Exception as e:
@@ -221,6 +647,11 @@ Examples:
   python internal/mcp_http_test_client.py --list-tools
   python internal/mcp_http_test_client.py --call http_request '{"url": "https://httpbin.org/get", "method": "GET"}'
   python internal/mcp_http_test_client.py --workflow fetch-url '{"url": "https://httpbin.org/get"}'
+
+  # Fire several calls concurrently:
+  python internal/mcp_http_test_client.py --parallel 4 \\
+      --call http_request '{"url": "https://httpbin.org/get"}' \\
+      --call http_request '{"url": "https://httpbin.org/uuid"}'
         """,
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
@@ -239,8 +670,16 @@ Examples:
     parser.add_argument(
         "--call",
         nargs=2,
+        action="append",
         metavar=("TOOL", "ARGS"),
-        help="Call a tool with JSON args",
+        help="Call a tool with JSON args (repeatable)",
+    )
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Run repeated --call requests with up to N in flight (default: 1)",
     )
     parser.add_argument(
         "--workflow",
@@ -256,68 +695,108 @@ Examples:
         help="Wait up to N seconds for server to be ready (default: 0, fail immediately if not ready)",
     )
 
-    args = parser.parse_args()
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent JSON results from --call/--workflow (default: compact)",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Send initialize and the operation in one JSON-RPC batch POST "
+        "(needs a server that accepts batches; Ploston's /mcp does not)",
+    )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Log every JSON-RPC request sent to stderr",
+    )
 
-    client = MCPHTTPTestClient(args.host, args.port)
+    args = parser.parse_args()
 
-    # Check if server is running
-    if args.wait > 0:
-        if not client.wait_for_server(timeout=args.wait):
-            print(
-                f"[ERROR] Server not ready at {client.base_url} after {args.wait}s",
-                file=sys.stderr,
-            )
+    client = MCPHTTPTestClient(
+        args.host,
+        args.port,
+        max_connections=max(8, args.parallel),
+        debug=args.debug,
+        batch=args.batch,
+    )
+    try:
+        # Check if server is running
+        if args.wait > 0:
+            if not client.wait_for_server(timeout=args.wait):
+                print(
+                    f"[ERROR] Server not ready at {client.base_url} after {args.wait}s",
+                    file=sys.stderr,
+                )
+                print(
+                    "[ERROR] Start the server with: docker compose -f docker-compose.test.yml up -d",
+                    file=sys.stderr,
+                )
+                sys.exit(1)
+        elif not client.is_server_running():
+            print(f"[ERROR] Server not running at {client.base_url}", file=sys.stderr)
             print(
                 "[ERROR] Start the server with: docker compose -f docker-compose.test.yml up -d",
                 file=sys.stderr,
             )
             sys.exit(1)
-    elif not client.is_server_running():
-        print(f"[ERROR] Server not running at {client.base_url}", file=sys.stderr)
+
+        # Initialize the MCP session before the requested operation (in the
+        # same POST with --batch), or skip it if a recent handshake is cached
+        if args.list_tools:
+            init_response, op_response = client.send_initialized("tools/list", {})
+        elif args.call:
+            calls = [(name, json_loads(args_json)) for name, args_json in args.call]
+            if len(calls) == 1:
+                tool_name, arguments = calls[0]
+                init_response, op_response = client.send_initialized(
+                    "tools/call", {"name": tool_name, "arguments": arguments}
+                )
+                results = [result_from_response(op_response)]
+            else:
+                init_response = client.cached_initialize() or client.initialize()
+                results = client.call_tools(calls, parallel=args.parallel)
+        elif args.workflow:
+            workflow_name, inputs_json = args.workflow
+            init_response, op_response = client.send_initialized(
+                "tools/call",
+                {"name": f"workflow:{workflow_name}", "arguments": json_loads(inputs_json)},
+            )
+        else:
+            init_response = client.initialize()
         print(
-            "[ERROR] Start the server with: docker compose -f docker-compose.test.yml up -d",
+            f"[CLIENT] Connected to: {init_response.get('result', {}).get('serverInfo', {})}",
             file=sys.stderr,
         )
-        sys.exit(1)
 
-    # Initialize MCP session
-    init_response = client.initialize()
-    print(
-        f"[CLIENT] Connected to: {init_response.get('result', {}).get('serverInfo', {})}",
-        file=sys.stderr,
-    )
+        if args.list_tools:
+            tools = sorted(tools_from_response(op_response), key=itemgetter("name"))
+            rule = "=" * 60
+            sys.stdout.write(
+                f"\n{rule}\nAvailable Tools ({len(tools)})\n{rule}\n\n"
+                f"{format_tool_table(tools, 50)}\n"
+            )
 
-    if args.list_tools:
-        tools = client.list_tools()
-        print(f"\n{'=' * 60}")
-        print(f"Available Tools ({len(tools)})")
-        print(f"{'=' * 60}\n")
-        for t in sorted(tools, key=lambda x: x["name"]):
-            desc = t.get("description", "")[:50]
-            print(f"  {t['name']:<40} {desc}")
-        print()
-
-    elif args.call:
-        tool_name, args_json = args.call
-        arguments = json.loads(args_json)
-        result = client.call_tool(tool_name, arguments)
-        print(f"\n{'=' * 60}")
-        print(f"Tool: {tool_name}")
-        print(f"{'=' * 60}")
-        print_json(result)
-
-    elif args.workflow:
-        workflow_name, inputs_json = args.workflow
-        inputs = json.loads(inputs_json)
-        result = client.call_tool(f"workflow:{workflow_name}", inputs)
-        print(f"\n{'=' * 60}")
-        print(f"Workflow: {workflow_name}")
-        print(f"{'=' * 60}")
-        print_json(result)
-
-    else:
-        # Interactive mode
-        interactive_mode(client)
+        elif args.call:
+            for (tool_name, _), result in zip(calls, results, strict=True):
+                print(f"\n{'=' * 60}")
+                print(f"Tool: {tool_name}")
+                print(f"{'=' * 60}")
+                print_json(result, pretty=args.pretty)
+
+        elif args.workflow:
+            result = result_from_response(op_response)
+            print(f"\n{'=' * 60}")
+            print(f"Workflow: {workflow_name}")
+            print(f"{'=' * 60}")
+            print_json(result, pretty=args.pretty)
+
+        else:
+            # Interactive mode
+            interactive_mode(client)
+    finally:
+        client.close()
 
 
 if __name__ == "__main__":
@@ -2,11 +2,33 @@
 
 This module provides the FastMCP server wrapper that exposes native tools
 from ploston_core.native_tools via the Model Context Protocol (MCP).
+
+Exports are resolved lazily (PEP 562) so importing one submodule does not
+drag in the others. In particular, ``python -m ploston.native_tools.server``
+no longer imports ``server`` once from this package and then again as
+``__main__``.
 """
 
-from .config_manager import ConfigManager, ToolConfig, get_config, get_config_manager
-from .config_watcher import NativeToolsConfig, RedisConfigWatcher, RedisConfigWatcherOptions
-from .server import mcp
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .config_manager import ConfigManager, ToolConfig, get_config, get_config_manager
+    from .config_watcher import NativeToolsConfig, RedisConfigWatcher, RedisConfigWatcherOptions
+    from .server import mcp
+
+_EXPORTS = {
+    "mcp": ".server",
+    "ConfigManager": ".config_manager",
+    "ToolConfig": ".config_manager",
+    "get_config": ".config_manager",
+    "get_config_manager": ".config_manager",
+    "NativeToolsConfig": ".config_watcher",
+    "RedisConfigWatcher": ".config_watcher",
+    "RedisConfigWatcherOptions": ".config_watcher",
+}
 
 __all__ = [
     "mcp",
@@ -18,3 +40,16 @@ __all__ = [
     "RedisConfigWatcher",
     "RedisConfigWatcherOptions",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -8,7 +8,8 @@ from __future__ import annotations
 
 import logging
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from typing import Any, Callable, Optional
 
 from ploston_core.native_tools.utils import (
@@ -30,6 +31,18 @@ DEFAULT_MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
 DEFAULT_MAX_DATA_SIZE = 50 * 1024 * 1024  # 50MB
 
 
+@lru_cache(maxsize=128)
+def _resolve_url_cached(url: str) -> str:
+    """Memoised resolve_url_for_docker; config reloads mostly repeat the same URLs."""
+    return resolve_url_for_docker(url)
+
+
+@lru_cache(maxsize=128)
+def _resolve_kafka_cached(bootstrap_servers: str) -> str:
+    """Memoised resolve_kafka_servers_for_docker."""
+    return resolve_kafka_servers_for_docker(bootstrap_servers)
+
+
 def _default_workspace_dir() -> str:
     """Resolve the default workspace, failing closed away from CWD (PL-C3).
 
@@ -46,9 +59,14 @@ def _default_workspace_dir() -> str:
     return DEFAULT_WORKSPACE_DIR
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ToolConfig:
-    """Current tool configuration values."""
+    """Current tool configuration values.
+
+    Immutable: a config change builds a new instance (``dataclasses.replace``)
+    and hands it to the change callbacks, so a reader never sees a half-applied
+    update.
+    """
 
     # Workspace
     workspace_dir: str = DEFAULT_WORKSPACE_DIR
@@ -84,6 +102,74 @@ class ToolConfig:
     default_embedding_model: str = "all-minilm:latest"
 
 
+# Environment variables loaded by ConfigManager._load_from_env, as
+# (env var, ToolConfig attribute, default, resolver or None). WORKSPACE_DIR is
+# handled separately because its fallback warns (PL-C3).
+_ENV_FIELDS: tuple[tuple[str, str, Optional[str], Optional[Callable[[str], str]]], ...] = (
+    ("FIRECRAWL_BASE_URL", "firecrawl_base_url", "http://localhost:3002", _resolve_url_cached),
+    ("FIRECRAWL_API_KEY", "firecrawl_api_key", None, None),
+    ("KAFKA_BOOTSTRAP_SERVERS", "kafka_bootstrap_servers", "localhost:9092", _resolve_kafka_cached),
+    ("KAFKA_CLIENT_ID", "kafka_client_id", "mcp-native-tools", None),
+    ("KAFKA_SECURITY_PROTOCOL", "kafka_security_protocol", "PLAINTEXT", None),
+    ("KAFKA_SASL_MECHANISM", "kafka_sasl_mechanism", None, None),
+    ("KAFKA_SASL_USERNAME", "kafka_sasl_username", None, None),
+    ("KAFKA_SASL_PASSWORD", "kafka_sasl_password", None, None),
+    ("OLLAMA_HOST", "ollama_host", "http://localhost:11434", _resolve_url_cached),
+    ("DEFAULT_EMBEDDING_MODEL", "default_embedding_model", "all-minilm:latest", None),
+)
+
+# Redis config sections applied by ConfigManager._handle_config_change when
+# enabled, as section -> ((section field, ToolConfig attribute, converter), ...).
+# List fields are copied so ToolConfig never aliases the pydantic model.
+_REDIS_FIELDS: tuple[
+    tuple[str, tuple[tuple[str, str, Optional[Callable[[Any], Any]]], ...]], ...
+] = (
+    (
+        "firecrawl",
+        (
+            ("base_url", "firecrawl_base_url", _resolve_url_cached),
+            ("api_key", "firecrawl_api_key", None),
+        ),
+    ),
+    (
+        "kafka",
+        (
+            ("bootstrap_servers", "kafka_bootstrap_servers", _resolve_kafka_cached),
+            ("security_protocol", "kafka_security_protocol", None),
+            ("sasl_mechanism", "kafka_sasl_mechanism", None),
+            ("sasl_username", "kafka_sasl_username", None),
+            ("sasl_password", "kafka_sasl_password", None),
+        ),
+    ),
+    (
+        "ollama",
+        (
+            ("host", "ollama_host", _resolve_url_cached),
+            ("default_model", "default_embedding_model", None),
+        ),
+    ),
+    # Filesystem and network security fields (PL-C5) are enforced by the fs
+    # tools and http_request's SSRF guard, not just decorative.
+    (
+        "filesystem",
+        (
+            ("workspace_dir", "workspace_dir", None),
+            ("allowed_paths", "allowed_paths", list),
+            ("denied_paths", "denied_paths", list),
+            ("max_file_size", "max_file_size", None),
+        ),
+    ),
+    (
+        "network",
+        (
+            ("allowed_hosts", "allowed_hosts", list),
+            ("denied_hosts", "denied_hosts", list),
+        ),
+    ),
+    ("data", (("max_data_size", "max_data_size", None),)),
+)
+
+
 class ConfigManager:
     """Manages native-tools configuration with Redis integration.
 
@@ -103,29 +189,15 @@ class ConfigManager:
 
     def _load_from_env(self) -> None:
         """Load configuration from environment variables."""
-        workspace_env = os.getenv("WORKSPACE_DIR")
-        self._config.workspace_dir = workspace_env or _default_workspace_dir()
-
-        # Firecrawl
-        raw_firecrawl_url = os.getenv("FIRECRAWL_BASE_URL", "http://localhost:3002")
-        self._config.firecrawl_base_url = resolve_url_for_docker(raw_firecrawl_url)
-        self._config.firecrawl_api_key = os.getenv("FIRECRAWL_API_KEY")
-
-        # Kafka
-        raw_kafka_servers = os.getenv("KAFKA_BOOTSTRAP_SERVERS", "localhost:9092")
-        self._config.kafka_bootstrap_servers = resolve_kafka_servers_for_docker(raw_kafka_servers)
-        self._config.kafka_client_id = os.getenv("KAFKA_CLIENT_ID", "mcp-native-tools")
-        self._config.kafka_security_protocol = os.getenv("KAFKA_SECURITY_PROTOCOL", "PLAINTEXT")
-        self._config.kafka_sasl_mechanism = os.getenv("KAFKA_SASL_MECHANISM")
-        self._config.kafka_sasl_username = os.getenv("KAFKA_SASL_USERNAME")
-        self._config.kafka_sasl_password = os.getenv("KAFKA_SASL_PASSWORD")
-
-        # Ollama
-        raw_ollama_host = os.getenv("OLLAMA_HOST", "http://localhost:11434")
-        self._config.ollama_host = resolve_url_for_docker(raw_ollama_host)
-        self._config.default_embedding_model = os.getenv(
-            "DEFAULT_EMBEDDING_MODEL", "all-minilm:latest"
-        )
+        # One snapshot gives a consistent view and avoids repeated os.getenv calls.
+        env = os.environ.copy()
+        updates: dict[str, Any] = {
+            "workspace_dir": env.get("WORKSPACE_DIR") or _default_workspace_dir()
+        }
+        for env_key, attr, default, resolve in _ENV_FIELDS:
+            value = env.get(env_key, default)
+            updates[attr] = resolve(value) if resolve and value else value
+        self._config = replace(self._config, **updates)
 
         logger.info("Loaded config from environment")
 
@@ -171,6 +243,13 @@ class ConfigManager:
         if self._watcher:
             await self._watcher.stop()
             self._watcher = None
+        self.clear_resolver_cache()
+
+    @staticmethod
+    def clear_resolver_cache() -> None:
+        """Drop memoised Docker host resolutions (e.g. after the environment changes)."""
+        _resolve_url_cached.cache_clear()
+        _resolve_kafka_cached.cache_clear()
 
     def _handle_config_change(self, new_config: NativeToolsConfig) -> None:
         """Handle config change from Redis.
@@ -180,44 +259,15 @@ class ConfigManager:
         """
         logger.info("Applying config update from Redis")
 
-        # Update Firecrawl config
-        if new_config.firecrawl.enabled:
-            raw_url = new_config.firecrawl.base_url
-            self._config.firecrawl_base_url = resolve_url_for_docker(raw_url)
-            self._config.firecrawl_api_key = new_config.firecrawl.api_key
-
-        # Update Kafka config
-        if new_config.kafka.enabled:
-            raw_servers = new_config.kafka.bootstrap_servers
-            self._config.kafka_bootstrap_servers = resolve_kafka_servers_for_docker(raw_servers)
-            self._config.kafka_security_protocol = new_config.kafka.security_protocol
-            self._config.kafka_sasl_mechanism = new_config.kafka.sasl_mechanism
-            self._config.kafka_sasl_username = new_config.kafka.sasl_username
-            self._config.kafka_sasl_password = new_config.kafka.sasl_password
-
-        # Update Ollama config
-        if new_config.ollama.enabled:
-            raw_host = new_config.ollama.host
-            self._config.ollama_host = resolve_url_for_docker(raw_host)
-            self._config.default_embedding_model = new_config.ollama.default_model
-
-        # Update filesystem config (PL-C5): wire through the security fields so
-        # they are actually enforced by the fs tools, not just decorative.
-        if new_config.filesystem.enabled:
-            self._config.workspace_dir = new_config.filesystem.workspace_dir
-            self._config.allowed_paths = list(new_config.filesystem.allowed_paths)
-            self._config.denied_paths = list(new_config.filesystem.denied_paths)
-            self._config.max_file_size = new_config.filesystem.max_file_size
-
-        # Update network config (PL-C5): wire allow/deny hosts through to
-        # http_request's SSRF guard.
-        if new_config.network.enabled:
-            self._config.allowed_hosts = list(new_config.network.allowed_hosts)
-            self._config.denied_hosts = list(new_config.network.denied_hosts)
-
-        # Update data config (PL-C5).
-        if new_config.data.enabled:
-            self._config.max_data_size = new_config.data.max_data_size
+        updates: dict[str, Any] = {}
+        for section_name, fields in _REDIS_FIELDS:
+            section = getattr(new_config, section_name)
+            if not section.enabled:
+                continue
+            for source, attr, convert in fields:
+                value = getattr(section, source)
+                updates[attr] = convert(value) if convert else value
+        self._config = replace(self._config, **updates)
 
         # Notify callbacks
         for callback in self._on_change_callbacks:
@@ -11,11 +11,12 @@ import asyncio
 import logging
 import os
 import re
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Callable, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +24,7 @@ logger = logging.getLogger(__name__)
 class KafkaConfig(BaseModel):
     """Kafka configuration."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", defer_build=True)
 
     enabled: bool = False
     bootstrap_servers: str = ""
@@ -38,7 +39,7 @@ class KafkaConfig(BaseModel):
 class FirecrawlConfig(BaseModel):
     """Firecrawl configuration."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", defer_build=True)
 
     enabled: bool = False
     base_url: str = ""
@@ -50,7 +51,7 @@ class FirecrawlConfig(BaseModel):
 class OllamaConfig(BaseModel):
     """Ollama configuration."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", defer_build=True)
 
     enabled: bool = False
     host: str = "http://localhost:11434"
@@ -61,7 +62,7 @@ class OllamaConfig(BaseModel):
 class FilesystemConfig(BaseModel):
     """Filesystem configuration."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", defer_build=True)
 
     enabled: bool = True
     workspace_dir: str = "/workspace"
@@ -73,7 +74,7 @@ class FilesystemConfig(BaseModel):
 class NetworkConfig(BaseModel):
     """Network configuration."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", defer_build=True)
 
     enabled: bool = True
     timeout: int = 30
@@ -85,7 +86,7 @@ class NetworkConfig(BaseModel):
 class DataConfig(BaseModel):
     """Data transformation configuration."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", defer_build=True)
 
     enabled: bool = True
     max_data_size: int = 50 * 1024 * 1024  # 50MB
@@ -95,10 +96,12 @@ class NativeToolsConfig(BaseModel):
     """Configuration model for native-tools.
 
     Uses extra="ignore" for forward compatibility - new fields from
-    ploston won't break older native-tools versions.
+    ploston won't break older native-tools versions. Like every model and
+    validator in this module it uses defer_build, so importing the module
+    does no pydantic-core schema work when Redis watching is disabled.
     """
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", defer_build=True)
 
     kafka: KafkaConfig = Field(default_factory=KafkaConfig)
     firecrawl: FirecrawlConfig = Field(default_factory=FirecrawlConfig)
@@ -108,6 +111,44 @@ class NativeToolsConfig(BaseModel):
     data: DataConfig = Field(default_factory=DataConfig)
 
 
+# ${VAR} or ${VAR:-default}; compiled once rather than per resolve_env_vars call.
+_ENV_VAR_RE = re.compile(r"\$\{([^}:]+)(?::(-?)([^}]*))?\}")
+
+
+def _env_var_replacer(match: re.Match[str]) -> str:
+    var_name = match.group(1)
+    operator = match.group(2)  # '-' or None
+    operand = match.group(3)  # default value
+
+    env_value = os.environ.get(var_name)
+
+    if env_value is not None:
+        return env_value
+
+    # Variable not set
+    if operator == "-":
+        return operand or ""
+    else:
+        # Return empty string for unset vars (don't fail)
+        return ""
+
+
+class ConfigNotification(BaseModel):
+    """Config change notification published on the Redis channel."""
+
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    service: Optional[str] = None
+    version: int = 0
+
+
+# Parses stored config payloads straight from JSON in pydantic-core, without a
+# json.loads pass through Python objects first.
+_PAYLOAD_ADAPTER: TypeAdapter[dict[str, Any]] = TypeAdapter(
+    dict[str, Any], config=ConfigDict(defer_build=True)
+)
+
+
 def resolve_env_vars(value: str) -> str:
     """Resolve environment variable references in string.
 
@@ -121,30 +162,17 @@ def resolve_env_vars(value: str) -> str:
     Returns:
         String with env vars resolved
     """
-    pattern = r"\$\{([^}:]+)(?::(-?)([^}]*))?\}"
-
-    def replacer(match: re.Match[str]) -> str:
-        var_name = match.group(1)
-        operator = match.group(2)  # '-' or None
-        operand = match.group(3)  # default value
-
-        env_value = os.environ.get(var_name)
-
-        if env_value is not None:
-            return env_value
-
-        # Variable not set
-        if operator == "-":
-            return operand or ""
-        else:
-            # Return empty string for unset vars (don't fail)
-            return ""
-
-    return re.sub(pattern, replacer, value)
+    # Most config strings have no references; skip the regex engine for them.
+    if "${" not in value:
+        return value
+    return _ENV_VAR_RE.sub(_env_var_replacer, value)
 
 
 def resolve_config_env_vars(config: dict[str, Any]) -> dict[str, Any]:
-    """Recursively resolve env vars in config dict.
+    """Resolve env vars in every string of a nested config dict.
+
+    Walks the tree with an explicit stack rather than recursion and returns
+    a copy; the input is left untouched.
 
     Args:
         config: Configuration dictionary
@@ -152,15 +180,94 @@ def resolve_config_env_vars(config: dict[str, Any]) -> dict[str, Any]:
     Returns:
         Config with env vars resolved
     """
-    if isinstance(config, dict):
-        return {k: resolve_config_env_vars(v) for k, v in config.items()}
-    elif isinstance(config, list):
-        return [resolve_config_env_vars(item) for item in config]
-    elif isinstance(config, str):
+    if isinstance(config, str):
         return resolve_env_vars(config)
-    else:
+    if not isinstance(config, (dict, list)):
         return config
 
+    root: Any = {} if isinstance(config, dict) else [None] * len(config)
+    stack: list[tuple[Any, Any]] = [(config, root)]
+    while stack:
+        src, dst = stack.pop()
+        items = src.items() if isinstance(src, dict) else enumerate(src)
+        for key, value in items:
+            if isinstance(value, dict):
+                copy: Any = {}
+                stack.append((value, copy))
+            elif isinstance(value, list):
+                copy = [None] * len(value)
+                stack.append((value, copy))
+            elif isinstance(value, str):
+                copy = resolve_env_vars(value)
+            else:
+                copy = value
+            dst[key] = copy
+    return root
+
+
+def build_native_tools_config(data: dict[str, Any]) -> NativeToolsConfig:
+    """Build a NativeToolsConfig from a resolved config payload.
+
+    Every payload is fully validated: the filesystem and network sections
+    feed the PL-C5 sandbox, so a string where a list belongs or a ``"false"``
+    flag must be coerced or rejected, never passed through. The watcher only
+    builds once per distinct payload, so this is not on a hot path.
+
+    Args:
+        data: Config dict with env vars already resolved
+
+    Returns:
+        NativeToolsConfig instance
+
+    Raises:
+        pydantic.ValidationError: If a section has values of the wrong type
+    """
+    return NativeToolsConfig.model_validate(data)
+
+
+# One pooled redis.asyncio client per Redis URL, shared by everything in the
+# process that talks to that server (GETs and pub/sub draw from the same pool).
+# Holders acquire and release it; the pool closes when the last one releases.
+_SHARED_CLIENTS: dict[str, Any] = {}
+_SHARED_CLIENT_REFS: dict[str, int] = {}
+_SHARED_POOL_MAX_CONNECTIONS = 8
+
+
+def _acquire_shared_redis_client(url: str) -> Any:
+    """Return the shared client for ``url``, creating its pool on first use.
+
+    Every call must be paired with _release_shared_redis_client. redis.asyncio
+    is imported lazily (raising ImportError if missing) so the package stays
+    optional when Redis watching is disabled.
+    """
+    client = _SHARED_CLIENTS.get(url)
+    if client is None:
+        import redis.asyncio as redis
+
+        pool = redis.ConnectionPool.from_url(
+            url,
+            decode_responses=True,
+            max_connections=_SHARED_POOL_MAX_CONNECTIONS,
+        )
+        client = _SHARED_CLIENTS[url] = redis.Redis(connection_pool=pool)
+    _SHARED_CLIENT_REFS[url] = _SHARED_CLIENT_REFS.get(url, 0) + 1
+    return client
+
+
+async def _release_shared_redis_client(url: str) -> None:
+    """Drop one hold on the shared client for ``url``; close it after the last."""
+    refs = _SHARED_CLIENT_REFS.get(url, 0) - 1
+    if refs > 0:
+        _SHARED_CLIENT_REFS[url] = refs
+        return
+    _SHARED_CLIENT_REFS.pop(url, None)
+    client = _SHARED_CLIENTS.pop(url, None)
+    if client is not None:
+        try:
+            await client.aclose(close_connection_pool=True)
+        except Exception:
+            pass
+
 
 @dataclass
 class RedisConfigWatcherOptions:
@@ -180,6 +287,7 @@ class RedisConfigWatcherOptions:
     )
     reconnect_delay: float = 5.0
     max_reconnect_attempts: int = 0  # 0 = infinite
+    debounce_sec: float = 0.05  # window for coalescing bursts of notifications
 
 
 class RedisConfigWatcher:
@@ -210,9 +318,19 @@ class RedisConfigWatcher:
         self._running = False
         self._current_config: Optional[NativeToolsConfig] = None
         self._last_version: int = 0
+        self._last_payload: Optional[str] = None
+        self._last_raw_config: Optional[dict[str, Any]] = None
         self._connected = False
-        self._offline_since: Optional[datetime] = None
+        self._offline_since: Optional[datetime] = None  # wall clock, for display
+        self._offline_since_mono: Optional[float] = None  # for duration math
+        # Connected status, reused until the config version changes.
+        self._health_cache: Optional[dict[str, Any]] = None
         self._watch_task: Optional[asyncio.Task[None]] = None
+        # Notifications only record the newest pending version and wake the
+        # refresher, which fetches once per debounce window.
+        self._pending_version: int = 0
+        self._refresh_event = asyncio.Event()
+        self._refresh_task: Optional[asyncio.Task[None]] = None
 
     @property
     def connected(self) -> bool:
@@ -227,9 +345,22 @@ class RedisConfigWatcher:
     @property
     def offline_duration_seconds(self) -> Optional[float]:
         """Return how long we've been offline, or None if connected."""
-        if self._connected or self._offline_since is None:
+        if self._connected or self._offline_since_mono is None:
             return None
-        return (datetime.now(timezone.utc) - self._offline_since).total_seconds()
+        return time.monotonic() - self._offline_since_mono
+
+    def _mark_offline(self) -> None:
+        """Record the transition to offline (first failure only)."""
+        self._connected = False
+        if self._offline_since_mono is None:
+            self._offline_since_mono = time.monotonic()
+            self._offline_since = datetime.now(timezone.utc)
+
+    def _mark_online(self) -> None:
+        """Record a successful (re)connection."""
+        self._connected = True
+        self._offline_since = None
+        self._offline_since_mono = None
 
     async def start(self) -> bool:
         """Start watching for config changes.
@@ -241,25 +372,25 @@ class RedisConfigWatcher:
             return True
 
         try:
-            import redis.asyncio as redis
-
-            self._client = redis.from_url(
-                self._options.redis_url,
-                decode_responses=True,
-            )
+            self._client = _acquire_shared_redis_client(self._options.redis_url)
 
             # Test connection
             await self._client.ping()
-            self._connected = True
-            self._offline_since = None
+            self._mark_online()
             logger.info(f"Connected to Redis at {self._options.redis_url}")
 
+            # Build the deferred schemas before the first payload is validated
+            NativeToolsConfig.model_rebuild()
+            ConfigNotification.model_rebuild()
+            _PAYLOAD_ADAPTER.rebuild()
+
             # Fetch initial config
             await self._fetch_config()
 
             # Start watching
             self._running = True
             self._watch_task = asyncio.create_task(self._watch_loop())
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
 
             return True
 
@@ -268,22 +399,37 @@ class RedisConfigWatcher:
             return False
         except Exception as e:
             logger.error(f"Failed to connect to Redis: {e}")
-            self._connected = False
-            self._offline_since = datetime.now(timezone.utc)
+            self._mark_offline()
+            if self._client is not None:
+                await _release_shared_redis_client(self._options.redis_url)
+                self._client = None
             return False
 
     async def stop(self) -> None:
         """Stop watching for config changes."""
         self._running = False
 
-        if self._watch_task:
-            self._watch_task.cancel()
-            try:
-                await self._watch_task
-            except asyncio.CancelledError:
-                pass
-            self._watch_task = None
+        for task in (self._watch_task, self._refresh_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._watch_task = None
+        self._refresh_task = None
+
+        await self._close_pubsub()
 
+        if self._client:
+            await _release_shared_redis_client(self._options.redis_url)
+            self._client = None
+
+        self._connected = False
+        logger.info("Stopped config watcher")
+
+    async def _close_pubsub(self) -> None:
+        """Unsubscribe and release the pubsub connection, if any."""
         if self._pubsub:
             try:
                 await self._pubsub.unsubscribe()
@@ -292,16 +438,6 @@ class RedisConfigWatcher:
                 pass
             self._pubsub = None
 
-        if self._client:
-            try:
-                await self._client.aclose()
-            except Exception:
-                pass
-            self._client = None
-
-        self._connected = False
-        logger.info("Stopped config watcher")
-
     async def _fetch_config(self) -> None:
         """Fetch current config from Redis."""
         if not self._client:
@@ -311,23 +447,37 @@ class RedisConfigWatcher:
             key = f"{self._options.key_prefix}:{self._options.service_name}"
             data = await self._client.get(key)
 
-            if data:
-                import json
-
-                payload = json.loads(data)
+            # Identical payloads (duplicate notifications, refetch after
+            # reconnect) were already handled; skip parsing them.
+            if data and data != self._last_payload:
+                payload = _PAYLOAD_ADAPTER.validate_json(data)
                 version = payload.get("version", 0)
 
                 if version > self._last_version:
                     config_dict = payload.get("config", {})
-                    # Resolve env vars
-                    resolved = resolve_config_env_vars(config_dict)
-                    self._current_config = NativeToolsConfig.model_validate(resolved)
+                    if config_dict != self._last_raw_config:
+                        # Payloads are usually resolved before publishing; only
+                        # walk the tree when the raw JSON has a ${VAR} in it.
+                        resolved = (
+                            resolve_config_env_vars(config_dict) if "${" in data else config_dict
+                        )
+                        self._current_config = build_native_tools_config(resolved)
+
+                        logger.info(f"Loaded config version {version}")
+
+                        if self._on_config_change:
+                            self._on_config_change(self._current_config)
+                        # Only after the callback succeeded, so content it
+                        # rejected is re-applied when republished.
+                        self._last_raw_config = config_dict
+
+                    # A republish with a new version but the same content only
+                    # advances the version.
                     self._last_version = version
 
-                    logger.info(f"Loaded config version {version}")
-
-                    if self._on_config_change:
-                        self._on_config_change(self._current_config)
+                # Recorded only once handled, so a payload that failed to
+                # build is retried on the next fetch.
+                self._last_payload = data
 
         except Exception as e:
             logger.error(f"Failed to fetch config: {e}")
@@ -341,27 +491,41 @@ class RedisConfigWatcher:
                 if not self._client:
                     raise ConnectionError("No Redis client")
 
-                self._pubsub = self._client.pubsub()
+                # The pubsub object outlives reconnects; only its connection is
+                # released (see below) and re-acquired by subscribe().
+                if self._pubsub is None:
+                    self._pubsub = self._client.pubsub()
                 await self._pubsub.subscribe(self._options.channel)
 
-                self._connected = True
-                self._offline_since = None
-                reconnect_attempts = 0
-
-                async for message in self._pubsub.listen():
-                    if not self._running:
-                        break
+                self._mark_online()
 
-                    if message["type"] == "message":
-                        await self._handle_notification(message["data"])
+                while self._running:
+                    message = await self._pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=1.0
+                    )
+                    # A completed poll, even an empty one, proves the link is
+                    # healthy; a subscribe that drops at once still counts as
+                    # a failed attempt.
+                    reconnect_attempts = 0
+                    if message is None:
+                        continue
+
+                    # Drain whatever else is already queued so a burst costs
+                    # one fetch for its newest version rather than one each.
+                    batch = [message]
+                    while message := await self._pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=0
+                    ):
+                        batch.append(message)
+                    await self._handle_notifications(
+                        [m["data"] for m in batch if m["type"] == "message"]
+                    )
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.warning(f"Config watcher error: {e}")
-                self._connected = False
-                if self._offline_since is None:
-                    self._offline_since = datetime.now(timezone.utc)
+                self._mark_offline()
 
                 reconnect_attempts += 1
                 max_attempts = self._options.max_reconnect_attempts
@@ -371,14 +535,15 @@ class RedisConfigWatcher:
 
                 await asyncio.sleep(self._options.reconnect_delay)
 
-                # Try to reconnect
+                # Try to reconnect. The shared client's pool re-dials on
+                # demand, so keep it instead of building a new pool per
+                # attempt, and reset the pubsub (aclose() is the non-deprecated
+                # name for PubSub.reset()) so its dead connection goes back.
                 try:
-                    import redis.asyncio as redis
-
-                    self._client = redis.from_url(
-                        self._options.redis_url,
-                        decode_responses=True,
-                    )
+                    if self._pubsub is not None:
+                        await self._pubsub.aclose()
+                    if self._client is None:
+                        self._client = _acquire_shared_redis_client(self._options.redis_url)
                     await self._client.ping()
                 except Exception:
                     pass
@@ -389,39 +554,74 @@ class RedisConfigWatcher:
         Args:
             data: JSON notification data
         """
-        try:
-            import json
+        await self._handle_notifications([data])
+
+    async def _handle_notifications(self, batch: list[str]) -> None:
+        """Queue a refresh for the newest version in ``batch``.
+
+        The fetch itself happens in _refresh_loop, so a burst spread over
+        several reads still costs one fetch per debounce window.
 
-            notification = json.loads(data)
-            service = notification.get("service")
-            version = notification.get("version", 0)
+        Args:
+            batch: JSON notification data, oldest first
+        """
+        # Compared with the applied version, not the pending one: a fetch that
+        # ran before Redis held the notified version must be retried when that
+        # notification is re-sent.
+        current = self._last_version
+        newest = current
+        for data in batch:
+            try:
+                notification = ConfigNotification.model_validate_json(data)
+            except Exception as e:
+                logger.error(f"Failed to handle notification: {e}")
+                continue
 
             # Only process notifications for our service
-            if service != self._options.service_name:
-                return
+            if notification.service == self._options.service_name:
+                newest = max(newest, notification.version)
 
-            # Only process if version is newer
-            if version <= self._last_version:
-                return
+        # Only process if version is newer
+        if newest <= current:
+            return
 
-            logger.info(f"Received config update notification (version {version})")
-            await self._fetch_config()
+        logger.info(f"Received config update notification (version {newest})")
+        self._pending_version = max(self._pending_version, newest)
+        self._refresh_event.set()
 
-        except Exception as e:
-            logger.error(f"Failed to handle notification: {e}")
+    async def _refresh_loop(self) -> None:
+        """Fetch config once per burst of notifications."""
+        while self._running:
+            await self._refresh_event.wait()
+            await asyncio.sleep(self._options.debounce_sec)
+            # Cleared before fetching so notifications that land during the
+            # fetch schedule another pass.
+            self._refresh_event.clear()
+            if self._pending_version > self._last_version:
+                await self._fetch_config()
 
     def get_health_status(self) -> dict[str, Any]:
         """Get health status for health check endpoint.
 
+        The connected status is cached and shared between calls, so callers
+        must copy it before modifying it.
+
         Returns:
             Health status dict
         """
+        if self._connected:
+            cached = self._health_cache
+            if cached is None or cached["config_version"] != self._last_version:
+                cached = {"redis_connected": True, "config_version": self._last_version}
+                self._health_cache = cached
+            return cached
+
         status: dict[str, Any] = {
-            "redis_connected": self._connected,
+            "redis_connected": False,
             "config_version": self._last_version,
         }
 
-        if not self._connected and self._offline_since:
+        if self._offline_since:
             duration = self.offline_duration_seconds
             status["offline_since"] = self._offline_since.isoformat()
             status["offline_duration_seconds"] = duration
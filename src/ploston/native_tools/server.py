@@ -14,32 +14,54 @@ The server can run in two modes:
 import logging
 import sys
 
-# Configure standard logging to stderr
-root_logger = logging.getLogger()
-root_logger.handlers.clear()
-stderr_handler = logging.StreamHandler(sys.stderr)
-stderr_handler.setFormatter(logging.Formatter("%(levelname)-8s [%(name)s] %(message)s"))
-root_logger.addHandler(stderr_handler)
-root_logger.setLevel(logging.DEBUG)
-
-# Configure structlog to use stderr BEFORE any imports that use structlog
 import structlog
 
-structlog.configure(
-    processors=[
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.add_logger_name,
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.dev.ConsoleRenderer(colors=False),
-    ],
-    wrapper_class=structlog.stdlib.BoundLogger,
-    context_class=dict,
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    cache_logger_on_first_use=True,
-)
+
+def _configure_logging() -> logging.Handler:
+    """Route standard logging and structlog to stderr, once per process.
+
+    The module can be executed twice in one process (``python -m`` runs it as
+    ``__main__`` and a later import loads it again), so a second call finds
+    the handler installed by the first and returns it unchanged.
+    """
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers:
+        if getattr(handler, "_ploston_stderr", False):
+            return handler
+
+    # Configure standard logging to stderr
+    root_logger.handlers.clear()
+    stderr_handler = logging.StreamHandler(sys.stderr)
+    stderr_handler.setFormatter(logging.Formatter("%(levelname)-8s [%(name)s] %(message)s"))
+    stderr_handler._ploston_stderr = True  # type: ignore[attr-defined]
+    root_logger.addHandler(stderr_handler)
+    root_logger.setLevel(logging.DEBUG)
+
+    # Configure structlog to use stderr BEFORE any imports that use structlog
+    structlog.configure(
+        processors=[
+            structlog.stdlib.add_log_level,
+            structlog.stdlib.add_logger_name,
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.dev.ConsoleRenderer(colors=False),
+        ],
+        wrapper_class=structlog.stdlib.BoundLogger,
+        context_class=dict,
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        cache_logger_on_first_use=True,
+    )
+    return stderr_handler
+
+
+stderr_handler = _configure_logging()
 
 # Now safe to import other modules
-from typing import Any, Dict, List, Optional
+import asyncio
+from collections import OrderedDict
+from copy import deepcopy
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional
 
 from fastmcp import FastMCP
 from starlette.requests import Request
@@ -48,8 +70,9 @@ from starlette.responses import JSONResponse, Response
 # Reconfigure MCP library loggers to use stderr
 for logger_name in ["mcp", "mcp.client", "mcp.server", "fastmcp"]:
     mcp_logger = logging.getLogger(logger_name)
-    mcp_logger.handlers.clear()
-    mcp_logger.addHandler(stderr_handler)
+    if mcp_logger.handlers != [stderr_handler]:
+        mcp_logger.handlers.clear()
+        mcp_logger.addHandler(stderr_handler)
     mcp_logger.setLevel(logging.WARNING)
 
 # Import core tool implementations from ploston_core
@@ -110,56 +133,43 @@ mcp = FastMCP("native-tools")
 # Configuration - uses ConfigManager for reactive updates from Redis
 # =============================================================================
 
-# Get initial config from environment (ConfigManager handles this)
-_cfg = get_config()
-
-# These are accessed by tools - they get updated when config changes
-WORKSPACE_DIR = _cfg.workspace_dir
-# Security config (PL-C5) consumed by fs / network tools.
-MAX_FILE_SIZE = _cfg.max_file_size
-ALLOWED_PATHS = _cfg.allowed_paths
-DENIED_PATHS = _cfg.denied_paths
-ALLOWED_HOSTS = _cfg.allowed_hosts
-DENIED_HOSTS = _cfg.denied_hosts
-FIRECRAWL_BASE_URL = _cfg.firecrawl_base_url
-FIRECRAWL_API_KEY = _cfg.firecrawl_api_key
-KAFKA_BOOTSTRAP_SERVERS = _cfg.kafka_bootstrap_servers
-KAFKA_CLIENT_ID = _cfg.kafka_client_id
-KAFKA_SECURITY_PROTOCOL = _cfg.kafka_security_protocol
-KAFKA_SASL_MECHANISM = _cfg.kafka_sasl_mechanism
-KAFKA_SASL_USERNAME = _cfg.kafka_sasl_username
-KAFKA_SASL_PASSWORD = _cfg.kafka_sasl_password
-OLLAMA_HOST = _cfg.ollama_host
-DEFAULT_EMBEDDING_MODEL = _cfg.default_embedding_model
+# Get initial config from environment (ConfigManager handles this).
+# Tools read every setting off this one object at call time, and a config
+# change swaps it in a single rebind rather than updating many globals.
+_CURRENT_CFG: ToolConfig = get_config()
+
+
+def _kafka_kwargs(config: ToolConfig) -> Mapping[str, Any]:
+    """Build the connection arguments shared by every kafka_* tool.
+
+    SASL settings only apply to the SASL_* protocols, so they are left out
+    for PLAINTEXT (the default) and the Kafka helpers fall back to None.
+    """
+    kwargs: dict[str, Any] = {
+        "bootstrap_servers": config.kafka_bootstrap_servers,
+        "client_id": config.kafka_client_id,
+        "security_protocol": config.kafka_security_protocol,
+    }
+    if config.kafka_security_protocol != "PLAINTEXT":
+        kwargs["sasl_mechanism"] = config.kafka_sasl_mechanism
+        kwargs["sasl_username"] = config.kafka_sasl_username
+        kwargs["sasl_password"] = config.kafka_sasl_password
+    return MappingProxyType(kwargs)
+
+
+# Rebuilt only when the config changes, so a Kafka tool call unpacks one
+# read-only mapping instead of reading six config fields.
+_KAFKA_KWARGS: Mapping[str, Any] = _kafka_kwargs(_CURRENT_CFG)
 
 
 def _update_config_globals(new_config: ToolConfig) -> None:
-    """Update global config variables when config changes.
+    """Publish the new config to the tools when config changes.
 
     This is called by the ConfigManager when Redis publishes new config.
     """
-    global WORKSPACE_DIR, FIRECRAWL_BASE_URL, FIRECRAWL_API_KEY
-    global KAFKA_BOOTSTRAP_SERVERS, KAFKA_CLIENT_ID, KAFKA_SECURITY_PROTOCOL
-    global KAFKA_SASL_MECHANISM, KAFKA_SASL_USERNAME, KAFKA_SASL_PASSWORD
-    global OLLAMA_HOST, DEFAULT_EMBEDDING_MODEL
-    global MAX_FILE_SIZE, ALLOWED_PATHS, DENIED_PATHS, ALLOWED_HOSTS, DENIED_HOSTS
-
-    WORKSPACE_DIR = new_config.workspace_dir
-    MAX_FILE_SIZE = new_config.max_file_size
-    ALLOWED_PATHS = new_config.allowed_paths
-    DENIED_PATHS = new_config.denied_paths
-    ALLOWED_HOSTS = new_config.allowed_hosts
-    DENIED_HOSTS = new_config.denied_hosts
-    FIRECRAWL_BASE_URL = new_config.firecrawl_base_url
-    FIRECRAWL_API_KEY = new_config.firecrawl_api_key
-    KAFKA_BOOTSTRAP_SERVERS = new_config.kafka_bootstrap_servers
-    KAFKA_CLIENT_ID = new_config.kafka_client_id
-    KAFKA_SECURITY_PROTOCOL = new_config.kafka_security_protocol
-    KAFKA_SASL_MECHANISM = new_config.kafka_sasl_mechanism
-    KAFKA_SASL_USERNAME = new_config.kafka_sasl_username
-    KAFKA_SASL_PASSWORD = new_config.kafka_sasl_password
-    OLLAMA_HOST = new_config.ollama_host
-    DEFAULT_EMBEDDING_MODEL = new_config.default_embedding_model
+    global _CURRENT_CFG, _KAFKA_KWARGS
+    _CURRENT_CFG = new_config
+    _KAFKA_KWARGS = _kafka_kwargs(new_config)
 
     print("[Config] Updated configuration from Redis", file=sys.stderr)
 
@@ -167,34 +177,55 @@ def _update_config_globals(new_config: ToolConfig) -> None:
 # Register callback for config changes
 get_config_manager().on_change(_update_config_globals)
 
-# Log resolved configuration if in Docker
-if is_running_in_docker():
-    print(f"[Docker] FIRECRAWL_BASE_URL: {FIRECRAWL_BASE_URL}", file=sys.stderr)
-    print(f"[Docker] KAFKA_BOOTSTRAP_SERVERS: {KAFKA_BOOTSTRAP_SERVERS}", file=sys.stderr)
-    print(f"[Docker] OLLAMA_HOST: {OLLAMA_HOST}", file=sys.stderr)
+
+@lru_cache(maxsize=1)
+def _in_docker() -> bool:
+    """Whether we run in a container; probed once per process."""
+    return is_running_in_docker()
+
+
+def _log_startup_config() -> None:
+    """Log the resolved endpoints when running in Docker.
+
+    Called from the entry points rather than at import, so importing this
+    module does not probe the container runtime.
+    """
+    if not _in_docker():
+        return
+    cfg = _CURRENT_CFG
+    sys.stderr.write(
+        f"[Docker] FIRECRAWL_BASE_URL: {cfg.firecrawl_base_url}\n"
+        f"[Docker] KAFKA_BOOTSTRAP_SERVERS: {cfg.kafka_bootstrap_servers}\n"
+        f"[Docker] OLLAMA_HOST: {cfg.ollama_host}\n"
+    )
 
 
 # =============================================================================
 # Filesystem Tools
 # =============================================================================
 
+# The fs helpers do blocking disk I/O, so they run on a worker thread rather
+# than on the event loop.
+
 
 @mcp.tool()
-def fs_read(path: str, encoding: str = "utf-8", format: str = "text") -> Dict[str, Any]:
+async def fs_read(path: str, encoding: str = "utf-8", format: str = "text") -> Dict[str, Any]:
     """Read content from a file with format parsing."""
-    return read_file_content(
+    cfg = _CURRENT_CFG
+    return await asyncio.to_thread(
+        read_file_content,
         path=path,
-        workspace_dir=WORKSPACE_DIR,
+        workspace_dir=cfg.workspace_dir,
         encoding=encoding,
         format=format,
-        max_file_size=MAX_FILE_SIZE,
-        allowed_paths=ALLOWED_PATHS,
-        denied_paths=DENIED_PATHS,
+        max_file_size=cfg.max_file_size,
+        allowed_paths=cfg.allowed_paths,
+        denied_paths=cfg.denied_paths,
     )
 
 
 @mcp.tool()
-def fs_write(
+async def fs_write(
     path: str,
     content: Any,
     format: str = "text",
@@ -203,22 +234,24 @@ def fs_write(
     create_dirs: bool = True,
 ) -> Dict[str, Any]:
     """Write content to a file with format serialization."""
-    return write_file_content(
+    cfg = _CURRENT_CFG
+    return await asyncio.to_thread(
+        write_file_content,
         path=path,
         content=content,
-        workspace_dir=WORKSPACE_DIR,
+        workspace_dir=cfg.workspace_dir,
         format=format,
         encoding=encoding,
         overwrite=overwrite,
         create_dirs=create_dirs,
-        max_file_size=MAX_FILE_SIZE,
-        allowed_paths=ALLOWED_PATHS,
-        denied_paths=DENIED_PATHS,
+        max_file_size=cfg.max_file_size,
+        allowed_paths=cfg.allowed_paths,
+        denied_paths=cfg.denied_paths,
     )
 
 
 @mcp.tool()
-def fs_list(
+async def fs_list(
     path: str = ".",
     recursive: bool = False,
     pattern: Optional[str] = None,
@@ -227,28 +260,32 @@ def fs_list(
     include_hidden: bool = False,
 ) -> Dict[str, Any]:
     """List directory contents with filtering options."""
-    return list_directory_content(
+    cfg = _CURRENT_CFG
+    return await asyncio.to_thread(
+        list_directory_content,
         path=path,
-        workspace_dir=WORKSPACE_DIR,
+        workspace_dir=cfg.workspace_dir,
         recursive=recursive,
         pattern=pattern,
         include_files=include_files,
         include_dirs=include_dirs,
         include_hidden=include_hidden,
-        allowed_paths=ALLOWED_PATHS,
-        denied_paths=DENIED_PATHS,
+        allowed_paths=cfg.allowed_paths,
+        denied_paths=cfg.denied_paths,
     )
 
 
 @mcp.tool()
-def fs_delete(path: str, recursive: bool = False) -> Dict[str, Any]:
+async def fs_delete(path: str, recursive: bool = False) -> Dict[str, Any]:
     """Delete a file or directory."""
-    return delete_file_or_directory(
+    cfg = _CURRENT_CFG
+    return await asyncio.to_thread(
+        delete_file_or_directory,
         path=path,
-        workspace_dir=WORKSPACE_DIR,
+        workspace_dir=cfg.workspace_dir,
         recursive=recursive,
-        allowed_paths=ALLOWED_PATHS,
-        denied_paths=DENIED_PATHS,
+        allowed_paths=cfg.allowed_paths,
+        denied_paths=cfg.denied_paths,
     )
 
 
@@ -269,6 +306,7 @@ async def http_request(
     retry_delay: int = 1,
 ) -> Dict[str, Any]:
     """Make HTTP requests with retry logic."""
+    cfg = _CURRENT_CFG
     return await make_http_request(
         url=url,
         method=method,
@@ -278,8 +316,8 @@ async def http_request(
         timeout=timeout,
         max_retries=max_retries,
         retry_delay=retry_delay,
-        allowed_hosts=ALLOWED_HOSTS,
-        denied_hosts=DENIED_HOSTS,
+        allowed_hosts=cfg.allowed_hosts,
+        denied_hosts=cfg.denied_hosts,
     )
 
 
@@ -301,6 +339,38 @@ async def network_port_check(host: str, port: int, timeout: int = 5) -> Dict[str
     return await check_port(host=host, port=port, timeout=timeout)
 
 
+# Upper bound on probes a *_many tool keeps in flight at once.
+_NETWORK_FANOUT_LIMIT = 16
+
+
+async def _gather_limited(calls: List[Callable[[], Awaitable[Dict[str, Any]]]]) -> Dict[str, Any]:
+    """Run probe calls concurrently, at most _NETWORK_FANOUT_LIMIT at a time."""
+    semaphore = asyncio.Semaphore(_NETWORK_FANOUT_LIMIT)
+
+    async def run(call: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        async with semaphore:
+            return await call()
+
+    results = await asyncio.gather(*(run(call) for call in calls))
+    return {"success": True, "count": len(results), "results": list(results)}
+
+
+@mcp.tool()
+async def network_ping_many(hosts: List[str], count: int = 4, timeout: int = 5) -> Dict[str, Any]:
+    """Ping several hosts concurrently; results follow the order of ``hosts``."""
+    return await _gather_limited(
+        [partial(ping_host, host=host, count=count, timeout=timeout) for host in hosts]
+    )
+
+
+@mcp.tool()
+async def network_port_check_many(host: str, ports: List[int], timeout: int = 5) -> Dict[str, Any]:
+    """Check several ports on a host concurrently; results follow ``ports``."""
+    return await _gather_limited(
+        [partial(check_port, host=host, port=port, timeout=timeout) for port in ports]
+    )
+
+
 # =============================================================================
 # Data Transformation Tools
 # =============================================================================
@@ -364,7 +434,7 @@ async def extract_structured(
 @mcp.tool()
 async def extract_file_metadata(file_path: str) -> Dict[str, Any]:
     """Extract metadata from files."""
-    return await extract_metadata(file_path=file_path, workspace_dir=WORKSPACE_DIR)
+    return await extract_metadata(file_path=file_path, workspace_dir=_CURRENT_CFG.workspace_dir)
 
 
 # =============================================================================
@@ -401,14 +471,9 @@ async def kafka_publish(
     return await publish_message_kafka(
         topic=topic,
         message=message,
-        bootstrap_servers=KAFKA_BOOTSTRAP_SERVERS,
-        client_id=KAFKA_CLIENT_ID,
-        security_protocol=KAFKA_SECURITY_PROTOCOL,
         key=key,
-        sasl_mechanism=KAFKA_SASL_MECHANISM,
-        sasl_username=KAFKA_SASL_USERNAME,
-        sasl_password=KAFKA_SASL_PASSWORD,
         timeout=timeout,
+        **_KAFKA_KWARGS,
     )
 
 
@@ -416,15 +481,7 @@ async def kafka_publish(
 async def kafka_list_topics(timeout: int = 30) -> Dict[str, Any]:
     """List all Kafka topics."""
     _check_dependency("kafka")
-    return await list_topics_kafka(
-        bootstrap_servers=KAFKA_BOOTSTRAP_SERVERS,
-        client_id=KAFKA_CLIENT_ID,
-        security_protocol=KAFKA_SECURITY_PROTOCOL,
-        sasl_mechanism=KAFKA_SASL_MECHANISM,
-        sasl_username=KAFKA_SASL_USERNAME,
-        sasl_password=KAFKA_SASL_PASSWORD,
-        timeout=timeout,
-    )
+    return await list_topics_kafka(timeout=timeout, **_KAFKA_KWARGS)
 
 
 @mcp.tool()
@@ -435,15 +492,10 @@ async def kafka_create_topic(
     _check_dependency("kafka")
     return await create_topic_kafka(
         topic=topic,
-        bootstrap_servers=KAFKA_BOOTSTRAP_SERVERS,
-        client_id=KAFKA_CLIENT_ID,
-        security_protocol=KAFKA_SECURITY_PROTOCOL,
         num_partitions=num_partitions,
         replication_factor=replication_factor,
-        sasl_mechanism=KAFKA_SASL_MECHANISM,
-        sasl_username=KAFKA_SASL_USERNAME,
-        sasl_password=KAFKA_SASL_PASSWORD,
         timeout=timeout,
+        **_KAFKA_KWARGS,
     )
 
 
@@ -455,15 +507,10 @@ async def kafka_consume(
     _check_dependency("kafka")
     return await consume_messages_kafka(
         topic=topic,
-        bootstrap_servers=KAFKA_BOOTSTRAP_SERVERS,
-        client_id=KAFKA_CLIENT_ID,
-        security_protocol=KAFKA_SECURITY_PROTOCOL,
         group_id=group_id,
         max_messages=max_messages,
-        sasl_mechanism=KAFKA_SASL_MECHANISM,
-        sasl_username=KAFKA_SASL_USERNAME,
-        sasl_password=KAFKA_SASL_PASSWORD,
         timeout=timeout,
+        **_KAFKA_KWARGS,
     )
 
 
@@ -471,28 +518,50 @@ async def kafka_consume(
 async def kafka_health(timeout: int = 10) -> Dict[str, Any]:
     """Check Kafka cluster health."""
     # Note: kafka_health doesn't check dependency - it's used to check health
-    return await check_health_kafka(
-        bootstrap_servers=KAFKA_BOOTSTRAP_SERVERS,
-        client_id=KAFKA_CLIENT_ID,
-        security_protocol=KAFKA_SECURITY_PROTOCOL,
-        sasl_mechanism=KAFKA_SASL_MECHANISM,
-        sasl_username=KAFKA_SASL_USERNAME,
-        sasl_password=KAFKA_SASL_PASSWORD,
-        timeout=timeout,
-    )
+    return await check_health_kafka(timeout=timeout, **_KAFKA_KWARGS)
 
 
 # =============================================================================
 # ML Tools
 # =============================================================================
 
+# Ollama results are deterministic for a given (host, model, input), so
+# successful ones are kept in a small LRU instead of re-requested. Keys start
+# with the tool name; failures are never cached.
+_ML_CACHE_SIZE = 256
+_ML_CACHE: OrderedDict[tuple[Any, ...], Dict[str, Any]] = OrderedDict()
+
+
+async def _ml_cached(
+    key: tuple[Any, ...], call: Callable[[], Awaitable[Dict[str, Any]]]
+) -> Dict[str, Any]:
+    """Return a cached ML result for ``key``, or run ``call`` and cache it.
+
+    Results are deep-copied in and out (embeddings and classification
+    sub-objects are nested), so a caller mutating its result cannot corrupt
+    later hits.
+    """
+    cached = _ML_CACHE.get(key)
+    if cached is not None:
+        _ML_CACHE.move_to_end(key)
+        return deepcopy(cached)
+    result = await call()
+    if result.get("success"):
+        _ML_CACHE[key] = deepcopy(result)
+        if len(_ML_CACHE) > _ML_CACHE_SIZE:
+            _ML_CACHE.popitem(last=False)
+    return result
+
 
 @mcp.tool()
 async def ml_embed_text(text: str, model: Optional[str] = None) -> Dict[str, Any]:
     """Generate text embeddings using Ollama."""
+    cfg = _CURRENT_CFG
     _check_dependency("ollama")
-    return await generate_text_embedding(
-        text=text, model=model or DEFAULT_EMBEDDING_MODEL, ollama_host=OLLAMA_HOST
+    model = model or cfg.default_embedding_model
+    return await _ml_cached(
+        ("embed", cfg.ollama_host, model, text),
+        lambda: generate_text_embedding(text=text, model=model, ollama_host=cfg.ollama_host),
     )
 
 
@@ -501,15 +570,20 @@ async def ml_text_similarity(
     text1: str, text2: str, method: str = "cosine", model: Optional[str] = None
 ) -> Dict[str, Any]:
     """Calculate similarity between two texts."""
+    cfg = _CURRENT_CFG
     # Only check ollama if using embedding-based similarity
     if method in ("cosine", "euclidean"):
         _check_dependency("ollama")
-    return await calculate_text_similarity(
-        text1=text1,
-        text2=text2,
-        method=method,
-        model=model or DEFAULT_EMBEDDING_MODEL,
-        ollama_host=OLLAMA_HOST,
+    model = model or cfg.default_embedding_model
+    return await _ml_cached(
+        ("similarity", cfg.ollama_host, model, method, text1, text2),
+        lambda: calculate_text_similarity(
+            text1=text1,
+            text2=text2,
+            method=method,
+            model=model,
+            ollama_host=cfg.ollama_host,
+        ),
     )
 
 
@@ -518,12 +592,14 @@ async def ml_classify_text(
     text: str, categories: List[str], model: Optional[str] = None
 ) -> Dict[str, Any]:
     """Classify text into predefined categories."""
+    cfg = _CURRENT_CFG
     _check_dependency("ollama")
-    return await classify_text(
-        text=text,
-        categories=categories,
-        model=model or DEFAULT_EMBEDDING_MODEL,
-        ollama_host=OLLAMA_HOST,
+    model = model or cfg.default_embedding_model
+    return await _ml_cached(
+        ("classify", cfg.ollama_host, model, text, tuple(categories)),
+        lambda: classify_text(
+            text=text, categories=categories, model=model, ollama_host=cfg.ollama_host
+        ),
     )
 
 
@@ -548,15 +624,16 @@ async def firecrawl_search(
     exclude_domains: Optional[List[str]] = None,
 ) -> Dict[str, Any]:
     """Search the web using Firecrawl."""
+    cfg = _CURRENT_CFG
     _check_dependency("firecrawl")
     return await search_web_firecrawl(
         query=query,
-        base_url=FIRECRAWL_BASE_URL,
-        api_key=FIRECRAWL_API_KEY,
+        base_url=cfg.firecrawl_base_url,
+        api_key=cfg.firecrawl_api_key,
         limit=limit,
         sources=sources,
-        include_domains=include_domains or [],
-        exclude_domains=exclude_domains or [],
+        include_domains=include_domains,
+        exclude_domains=exclude_domains,
     )
 
 
@@ -565,11 +642,12 @@ async def firecrawl_map(
     url: str, limit: int = 1000, exclude_tags: Optional[List[str]] = None
 ) -> Dict[str, Any]:
     """Map a website to discover all URLs."""
+    cfg = _CURRENT_CFG
     _check_dependency("firecrawl")
     return await map_website_firecrawl(
         url=url,
-        base_url=FIRECRAWL_BASE_URL,
-        api_key=FIRECRAWL_API_KEY,
+        base_url=cfg.firecrawl_base_url,
+        api_key=cfg.firecrawl_api_key,
         limit=limit,
         exclude_tags=exclude_tags,
     )
@@ -580,11 +658,12 @@ async def firecrawl_extract(
     urls: List[str], schema: Optional[Dict[str, Any]] = None, prompt: Optional[str] = None
 ) -> Dict[str, Any]:
     """Extract structured data from URLs."""
+    cfg = _CURRENT_CFG
     _check_dependency("firecrawl")
     return await extract_data_firecrawl(
         urls=urls,
-        base_url=FIRECRAWL_BASE_URL,
-        api_key=FIRECRAWL_API_KEY,
+        base_url=cfg.firecrawl_base_url,
+        api_key=cfg.firecrawl_api_key,
         schema=schema,
         prompt=prompt,
     )
@@ -594,7 +673,7 @@ async def firecrawl_extract(
 async def firecrawl_health() -> Dict[str, Any]:
     """Check Firecrawl service health."""
     # Note: firecrawl_health doesn't check dependency - it's used to check health
-    return await check_health_firecrawl(base_url=FIRECRAWL_BASE_URL)
+    return await check_health_firecrawl(base_url=_CURRENT_CFG.firecrawl_base_url)
 
 
 # =============================================================================
@@ -705,23 +784,24 @@ def _update_native_tools_metrics() -> None:
 
 def _configure_health_manager() -> None:
     """Configure the health manager with current dependency settings."""
+    cfg = _CURRENT_CFG
     health_manager = get_health_manager()
 
     # Configure Kafka
     health_manager.configure_kafka(
-        bootstrap_servers=KAFKA_BOOTSTRAP_SERVERS,
-        client_id=KAFKA_CLIENT_ID,
-        security_protocol=KAFKA_SECURITY_PROTOCOL,
-        sasl_mechanism=KAFKA_SASL_MECHANISM,
-        sasl_username=KAFKA_SASL_USERNAME,
-        sasl_password=KAFKA_SASL_PASSWORD,
+        bootstrap_servers=cfg.kafka_bootstrap_servers,
+        client_id=cfg.kafka_client_id,
+        security_protocol=cfg.kafka_security_protocol,
+        sasl_mechanism=cfg.kafka_sasl_mechanism,
+        sasl_username=cfg.kafka_sasl_username,
+        sasl_password=cfg.kafka_sasl_password,
     )
 
     # Configure Ollama
-    health_manager.configure_ollama(host=OLLAMA_HOST)
+    health_manager.configure_ollama(host=cfg.ollama_host)
 
     # Configure Firecrawl
-    health_manager.configure_firecrawl(base_url=FIRECRAWL_BASE_URL)
+    health_manager.configure_firecrawl(base_url=cfg.firecrawl_base_url)
 
     print("[Health] Configured health manager for dependencies", file=sys.stderr)
 
@@ -733,6 +813,7 @@ def _configure_health_manager() -> None:
 
 async def start_with_redis() -> None:
     """Start the server with Redis config watcher and health manager."""
+    _log_startup_config()
 
     config_manager = get_config_manager()
 
@@ -751,9 +832,10 @@ async def start_with_redis() -> None:
 
 
 if __name__ == "__main__":
-    import asyncio
     import os
 
+    _log_startup_config()
+
     # Start Redis watcher and health manager before running MCP server
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
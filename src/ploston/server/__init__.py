@@ -100,7 +100,13 @@ def main():
             await app.shutdown()
             raise
 
-    asyncio.run(run_server())
+    # uvloop is optional; without it the server runs on the stdlib loop.
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(run_server())
+    else:
+        uvloop.run(run_server())
 
 
 if __name__ == "__main__":
@@ -8,10 +8,12 @@ This test was added after discovering that the server entry point was
 creating empty registries instead of properly initializing components.
 """
 
+import os
 import socket
 import subprocess
 import sys
 import tempfile
+import threading
 import time
 from pathlib import Path
 
@@ -58,6 +60,9 @@ telemetry:
     enabled: false
 """
 
+# _pump reads the raw pipe fds in chunks this large rather than line by line.
+PIPE_CHUNK_SIZE = 65536
+
 
 def find_free_port() -> int:
     """Find a free port to use for testing."""
@@ -66,13 +71,15 @@ def find_free_port() -> int:
         return s.getsockname()[1]
 
 
-@pytest.fixture
+# The server fixtures are module-scoped: every smoke test is read-only, so one
+# server boot serves the whole module instead of one cold start per test.
+@pytest.fixture(scope="module")
 def server_port() -> int:
     """Get a free port for the test server."""
     return find_free_port()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def config_file():
     """Create a temporary config file for testing."""
     # Create a temp directory for workflows
@@ -90,7 +97,19 @@ def config_file():
     shutil.rmtree(workflows_dir, ignore_errors=True)
 
 
-@pytest.fixture
+def _pump(stream, sink: list[bytes]) -> None:
+    """Drain a child pipe into ``sink`` so the server never blocks on a full pipe."""
+    fd = stream.fileno()
+    while chunk := os.read(fd, PIPE_CHUNK_SIZE):
+        sink.append(chunk)
+    stream.close()
+
+
+def _decode(chunks: list[bytes]) -> str:
+    return b"".join(chunks).decode(errors="replace")
+
+
+@pytest.fixture(scope="module")
 def server_process(server_port: int, config_file: Path):
     """Start the actual ploston server and yield the process.
 
@@ -111,9 +130,19 @@ def server_process(server_port: int, config_file: Path):
         ],
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        text=True,
     )
 
+    # Nothing reads the pipes otherwise; once the OS buffer fills the server
+    # would block on its next log write and the tests would hang.
+    stdout: list[bytes] = []
+    stderr: list[bytes] = []
+    pumps = [
+        threading.Thread(target=_pump, args=(process.stdout, stdout), daemon=True),
+        threading.Thread(target=_pump, args=(process.stderr, stderr), daemon=True),
+    ]
+    for pump in pumps:
+        pump.start()
+
     # Wait for server to be ready (max 10 seconds)
     start_time = time.time()
     server_ready = False
@@ -132,8 +161,12 @@ def server_process(server_port: int, config_file: Path):
 
     if not server_ready:
         process.kill()
-        stdout, stderr = process.communicate(timeout=5)
-        pytest.fail(f"Server failed to start.\nstdout: {stdout}\nstderr: {stderr}")
+        process.wait(timeout=5)
+        for pump in pumps:
+            pump.join(timeout=5)
+        pytest.fail(
+            f"Server failed to start.\nstdout: {_decode(stdout)}\nstderr: {_decode(stderr)}"
+        )
 
     yield process
 
@@ -143,6 +176,16 @@ def server_process(server_port: int, config_file: Path):
         process.wait(timeout=5)
     except subprocess.TimeoutExpired:
         process.kill()
+        process.wait()
+    for pump in pumps:
+        pump.join(timeout=5)
+
+
+@pytest.fixture(scope="module")
+def http_client(server_process, server_port: int):
+    """One pooled client for the module, so requests reuse a keep-alive connection."""
+    with httpx.Client(base_url=f"http://127.0.0.1:{server_port}", timeout=5) as client:
+        yield client
 
 
 class TestServerSmoke:
@@ -152,16 +195,16 @@ class TestServerSmoke:
         """Test that the server starts without errors."""
         assert server_process.poll() is None, "Server process should be running"
 
-    def test_health_endpoint(self, server_process, server_port):
+    def test_health_endpoint(self, http_client):
         """Test that /health endpoint responds."""
-        response = httpx.get(f"http://127.0.0.1:{server_port}/health", timeout=5)
+        response = http_client.get("/health")
         assert response.status_code == 200
 
-    def test_mcp_endpoint_exists(self, server_process, server_port):
+    def test_mcp_endpoint_exists(self, http_client):
         """Test that /mcp endpoint exists and accepts POST."""
         # Send MCP initialize request
-        response = httpx.post(
-            f"http://127.0.0.1:{server_port}/mcp",
+        response = http_client.post(
+            "/mcp",
             json={
                 "jsonrpc": "2.0",
                 "id": 1,
@@ -171,22 +214,18 @@ class TestServerSmoke:
                     "clientInfo": {"name": "smoke-test", "version": "1.0.0"},
                 },
             },
-            timeout=5,
         )
         assert response.status_code == 200
         data = response.json()
         assert "result" in data
         assert data["result"]["protocolVersion"] == "2024-11-05"
 
-    def test_rest_api_workflows_endpoint(self, server_process, server_port):
+    def test_rest_api_workflows_endpoint(self, http_client):
         """Test that REST API /api/v1/workflows endpoint responds.
 
         This is the critical test that would have caught the dual-mode issue.
         """
-        response = httpx.get(
-            f"http://127.0.0.1:{server_port}/api/v1/workflows",
-            timeout=5,
-        )
+        response = http_client.get("/api/v1/workflows")
         # Should return 200 with paginated response
         assert response.status_code == 200
         data = response.json()
@@ -194,12 +233,9 @@ class TestServerSmoke:
         assert isinstance(data, dict)
         assert "items" in data or "workflows" in data or "page" in data
 
-    def test_rest_api_tools_endpoint(self, server_process, server_port):
+    def test_rest_api_tools_endpoint(self, http_client):
         """Test that REST API /api/v1/tools endpoint responds."""
-        response = httpx.get(
-            f"http://127.0.0.1:{server_port}/api/v1/tools",
-            timeout=5,
-        )
+        response = http_client.get("/api/v1/tools")
         assert response.status_code == 200
         data = response.json()
         # API returns response with tools key
@@ -13,13 +13,17 @@ callbacks it fires.
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
 import json
 import sys
+import time
 import types
 
 import pytest
 
 from ploston.native_tools import config_manager as cm
+from ploston.native_tools import config_watcher
 from ploston.native_tools.config_watcher import (
     DataConfig,
     FirecrawlConfig,
@@ -28,6 +32,7 @@ from ploston.native_tools.config_watcher import (
     OllamaConfig,
     RedisConfigWatcher,
     RedisConfigWatcherOptions,
+    build_native_tools_config,
     resolve_config_env_vars,
     resolve_env_vars,
 )
@@ -67,6 +72,40 @@ class TestEnvVarResolution:
         # Non-string values pass through unchanged.
         assert resolved["n"] == 5
         assert resolved["flag"] is True
+        # The input is copied, not rewritten in place.
+        assert config["kafka"]["list"] == ["${BROKER}", "static"]
+
+
+class TestBuildNativeToolsConfig:
+    def test_payload_builds_nested_models_with_defaults(self):
+        config = build_native_tools_config(
+            {"kafka": {"enabled": True, "bootstrap_servers": "k:9092", "unknown": 1}}
+        )
+        assert isinstance(config.kafka, KafkaConfig)
+        assert config.kafka.bootstrap_servers == "k:9092"
+        assert config.kafka.security_protocol == "PLAINTEXT"
+        assert not hasattr(config.kafka, "unknown")
+        assert config.firecrawl == FirecrawlConfig()
+
+    def test_string_values_are_coerced(self):
+        config = build_native_tools_config(
+            {"kafka": {"enabled": "false"}, "data": {"max_data_size": "1024"}}
+        )
+        assert config.kafka.enabled is False
+        assert config.data.max_data_size == 1024
+
+    @pytest.mark.parametrize(
+        "section",
+        [
+            {"filesystem": {"allowed_paths": "/workspace/pub"}},
+            {"filesystem": {"allowed_paths": None}},
+            {"network": {"denied_hosts": "169.254.169.254"}},
+            {"data": {"max_data_size": "not-a-number"}},
+        ],
+    )
+    def test_mistyped_security_fields_are_rejected(self, section):
+        with pytest.raises(ValueError):
+            build_native_tools_config(section)
 
 
 # =============================================================================
@@ -132,6 +171,16 @@ class TestHandleConfigChange:
         mgr._handle_config_change(new)
         assert mgr.config.firecrawl_base_url == before
 
+    def test_change_publishes_new_frozen_config(self, monkeypatch):
+        mgr = _fresh_manager(monkeypatch)
+        old = mgr.config
+        mgr._handle_config_change(NativeToolsConfig(data=DataConfig(enabled=True, max_data_size=7)))
+        # The previous snapshot is left intact for readers still holding it.
+        assert mgr.config is not old
+        assert old.max_data_size == cm.DEFAULT_MAX_DATA_SIZE
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            mgr.config.max_data_size = 1
+
     def test_on_change_callback_invoked(self, monkeypatch):
         mgr = _fresh_manager(monkeypatch)
         seen = []
@@ -173,6 +222,27 @@ class TestConfigManagerRedisGating:
         status = mgr.get_health_status()
         assert status["config_source"] == "environment"
 
+    @pytest.mark.asyncio
+    async def test_docker_resolution_memoised_until_watcher_stops(self, monkeypatch):
+        calls = []
+
+        def fake_resolve(url):
+            calls.append(url)
+            return url
+
+        monkeypatch.setattr(cm, "resolve_url_for_docker", fake_resolve)
+        cm.ConfigManager.clear_resolver_cache()
+        mgr = _fresh_manager(monkeypatch)
+        new = NativeToolsConfig(firecrawl=FirecrawlConfig(enabled=True, base_url="http://fc:1"))
+        mgr._handle_config_change(new)
+        mgr._handle_config_change(new)
+        assert calls.count("http://fc:1") == 1
+
+        await mgr.stop_redis_watcher()
+        mgr._handle_config_change(new)
+        assert calls.count("http://fc:1") == 2
+        cm.ConfigManager.clear_resolver_cache()
+
 
 # =============================================================================
 # RedisConfigWatcher driven by a fake redis.asyncio client
@@ -188,9 +258,11 @@ class _FakePubSub:
     async def subscribe(self, channel):
         self.subscribed = channel
 
-    async def listen(self):
-        for m in self._messages:
-            yield m
+    async def get_message(self, ignore_subscribe_messages=False, timeout=0.0):
+        if self._messages:
+            return self._messages.pop(0)
+        await asyncio.sleep(timeout)
+        return None
 
     async def unsubscribe(self):
         pass
@@ -217,7 +289,7 @@ class _FakeRedisClient:
     def pubsub(self):
         return _FakePubSub(self._pubsub_messages)
 
-    async def aclose(self):
+    async def aclose(self, close_connection_pool=None):
         self.closed = True
 
 
@@ -226,15 +298,28 @@ def _install_fake_redis(monkeypatch, client):
     redis_pkg = types.ModuleType("redis")
     redis_async = types.ModuleType("redis.asyncio")
 
-    def from_url(url, decode_responses=True):
-        return client
+    class ConnectionPool:
+        @classmethod
+        def from_url(cls, url, **kwargs):
+            return cls()
 
-    redis_async.from_url = from_url
+    redis_async.ConnectionPool = ConnectionPool
+    redis_async.Redis = lambda connection_pool=None: client
     redis_pkg.asyncio = redis_async
+    # Each test gets its own fake client, so start from an empty shared cache.
+    monkeypatch.setattr(config_watcher, "_SHARED_CLIENTS", {})
+    monkeypatch.setattr(config_watcher, "_SHARED_CLIENT_REFS", {})
     monkeypatch.setitem(sys.modules, "redis", redis_pkg)
     monkeypatch.setitem(sys.modules, "redis.asyncio", redis_async)
 
 
+async def _wait_until(predicate, timeout=1.0):
+    """Yield to the watcher's background tasks until ``predicate()`` holds."""
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        await asyncio.sleep(0.01)
+
+
 def _config_payload(version, *, base_url="http://fc:3002"):
     return json.dumps(
         {
@@ -299,6 +384,119 @@ class TestRedisConfigWatcher:
         finally:
             await watcher.stop()
 
+    @pytest.mark.asyncio
+    async def test_fetch_skips_unchanged_content(self, monkeypatch):
+        received = []
+        key = "ploston:config:native-tools"
+        client = _FakeRedisClient(store={key: _config_payload(1)})
+        _install_fake_redis(monkeypatch, client)
+        watcher = RedisConfigWatcher(
+            options=RedisConfigWatcherOptions(redis_url="redis://x"),
+            on_config_change=lambda c: received.append(c),
+        )
+        await watcher.start()
+        try:
+            # Same bytes again: nothing to do.
+            await watcher._fetch_config()
+            # Version bumped, content identical: version tracked, no callback.
+            client._store[key] = _config_payload(2)
+            await watcher._fetch_config()
+            assert len(received) == 1
+            assert watcher.get_health_status()["config_version"] == 2
+            # Real change still applies.
+            client._store[key] = _config_payload(3, base_url="http://fc:9")
+            await watcher._fetch_config()
+            assert len(received) == 2
+            assert received[1].firecrawl.base_url == "http://fc:9"
+        finally:
+            await watcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_fetch_retries_payload_that_failed_to_build(self, monkeypatch):
+        received = []
+        key = "ploston:config:native-tools"
+        bad = json.dumps({"version": 1, "config": {"filesystem": {"allowed_paths": "/pub"}}})
+        client = _FakeRedisClient(store={key: bad})
+        _install_fake_redis(monkeypatch, client)
+        watcher = RedisConfigWatcher(
+            options=RedisConfigWatcherOptions(redis_url="redis://x"),
+            on_config_change=lambda c: received.append(c),
+        )
+        await watcher.start()
+        try:
+            # A string allow-list is rejected rather than split into characters,
+            # and the version is not consumed by the failure.
+            assert received == []
+            assert watcher.get_health_status()["config_version"] == 0
+            client._store[key] = json.dumps(
+                {"version": 1, "config": {"filesystem": {"allowed_paths": ["/pub"]}}}
+            )
+            await watcher._fetch_config()
+            assert len(received) == 1
+            assert received[0].filesystem.allowed_paths == ["/pub"]
+        finally:
+            await watcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_fetch_retries_content_whose_callback_failed(self, monkeypatch):
+        received = []
+
+        def on_change(config):
+            received.append(config)
+            if len(received) == 1:
+                raise RuntimeError("apply failed")
+
+        key = "ploston:config:native-tools"
+        client = _FakeRedisClient(store={key: _config_payload(1)})
+        _install_fake_redis(monkeypatch, client)
+        watcher = RedisConfigWatcher(
+            options=RedisConfigWatcherOptions(redis_url="redis://x"),
+            on_config_change=on_change,
+        )
+        await watcher.start()
+        try:
+            assert watcher.get_health_status()["config_version"] == 0
+            # Same content republished under a new version is applied again.
+            client._store[key] = _config_payload(2)
+            await watcher._fetch_config()
+            assert len(received) == 2
+            assert watcher.get_health_status()["config_version"] == 2
+        finally:
+            await watcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_fetch_coerces_env_substituted_values(self, monkeypatch):
+        monkeypatch.setenv("KAFKA_ON", "false")
+        monkeypatch.setenv("FS_MAX", "1024")
+        received = []
+        key = "ploston:config:native-tools"
+        payload = {
+            "version": 1,
+            "config": {
+                "kafka": {"enabled": "${KAFKA_ON:-true}", "bootstrap_servers": "b:9092"},
+                "filesystem": {"enabled": True, "max_file_size": "${FS_MAX}"},
+            },
+        }
+        client = _FakeRedisClient(store={key: json.dumps(payload)})
+        _install_fake_redis(monkeypatch, client)
+        watcher = RedisConfigWatcher(
+            options=RedisConfigWatcherOptions(redis_url="redis://x"),
+            on_config_change=lambda c: received.append(c),
+        )
+        await watcher.start()
+        try:
+            config = received[0]
+            assert config.kafka.enabled is False
+            assert config.filesystem.max_file_size == 1024
+
+            mgr = _fresh_manager(monkeypatch)
+            before = mgr.config.kafka_bootstrap_servers
+            mgr._handle_config_change(config)
+            assert mgr.config.kafka_bootstrap_servers == before
+            assert mgr.config.max_file_size == 1024
+        finally:
+            await watcher.stop()
+
     @pytest.mark.asyncio
     async def test_handle_notification_for_other_service_ignored(self, monkeypatch):
         received = []
@@ -334,11 +532,198 @@ class TestRedisConfigWatcher:
             await watcher._handle_notification(
                 json.dumps({"service": "native-tools", "version": 1})
             )
+            # The refresher fetches after the debounce window.
+            await _wait_until(lambda: received)
             assert len(received) == 1
             assert received[0].firecrawl.base_url == "http://fc:3002"
         finally:
             await watcher.stop()
 
+    @pytest.mark.asyncio
+    async def test_notifications_within_debounce_window_fetch_once(self, monkeypatch):
+        received = []
+        key = "ploston:config:native-tools"
+        client = _FakeRedisClient(store={})
+        _install_fake_redis(monkeypatch, client)
+        watcher = RedisConfigWatcher(
+            options=RedisConfigWatcherOptions(redis_url="redis://x", debounce_sec=0.05),
+            on_config_change=lambda c: received.append(c),
+        )
+        await watcher.start()
+        try:
+            for version in (1, 2, 3):
+                client._store[key] = _config_payload(version, base_url=f"http://fc:{version}")
+                await watcher._handle_notification(
+                    json.dumps({"service": "native-tools", "version": version})
+                )
+            await _wait_until(lambda: received)
+            await asyncio.sleep(0.1)
+            assert len(received) == 1
+            assert received[0].firecrawl.base_url == "http://fc:3"
+        finally:
+            await watcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_resent_notification_refetches_after_missed_version(self, monkeypatch):
+        received = []
+        key = "ploston:config:native-tools"
+        client = _FakeRedisClient(store={key: _config_payload(1)})
+        _install_fake_redis(monkeypatch, client)
+        watcher = RedisConfigWatcher(
+            options=RedisConfigWatcherOptions(redis_url="redis://x", debounce_sec=0),
+            on_config_change=lambda c: received.append(c),
+        )
+        await watcher.start()
+        notification = json.dumps({"service": "native-tools", "version": 2})
+        try:
+            # Notified before Redis holds version 2: the fetch finds version 1.
+            await watcher._handle_notification(notification)
+            await _wait_until(lambda: not watcher._refresh_event.is_set())
+            await asyncio.sleep(0.02)
+            assert len(received) == 1
+
+            client._store[key] = _config_payload(2, base_url="http://fc:2")
+            await watcher._handle_notification(notification)
+            await _wait_until(lambda: len(received) == 2)
+            assert received[-1].firecrawl.base_url == "http://fc:2"
+        finally:
+            await watcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_reconnect_reuses_shared_client_and_pubsub(self, monkeypatch):
+        class _BrokenPubSub(_FakePubSub):
+            subscribe_count = 0
+
+            async def subscribe(self, channel):
+                self.subscribe_count += 1
+
+            async def get_message(self, ignore_subscribe_messages=False, timeout=0.0):
+                raise ConnectionError("dropped")
+
+        pubsubs = []
+
+        class _Client(_FakeRedisClient):
+            def pubsub(self):
+                pubsubs.append(_BrokenPubSub())
+                return pubsubs[-1]
+
+        client = _Client()
+        _install_fake_redis(monkeypatch, client)
+        watcher = RedisConfigWatcher(
+            options=RedisConfigWatcherOptions(
+                redis_url="redis://x", reconnect_delay=0, max_reconnect_attempts=2
+            )
+        )
+        await watcher.start()
+        try:
+            # Subscribing then dropping at once still counts toward the limit.
+            await asyncio.wait_for(watcher._watch_task, timeout=5)
+            assert watcher._client is client
+            assert len(pubsubs) == 1
+            assert pubsubs[0].subscribe_count == 2
+            assert pubsubs[0].closed is True
+        finally:
+            await watcher.stop()
+        assert config_watcher._SHARED_CLIENTS == {}
+
+    @pytest.mark.asyncio
+    async def test_empty_poll_resets_reconnect_attempts(self, monkeypatch):
+        class _FlakyPubSub(_FakePubSub):
+            polls = 0
+
+            async def get_message(self, ignore_subscribe_messages=False, timeout=0.0):
+                # Each subscribe sees one healthy (empty) poll, then a drop.
+                self.polls += 1
+                if self.polls % 2:
+                    return None
+                raise ConnectionError("dropped")
+
+        pubsub = _FlakyPubSub()
+
+        class _Client(_FakeRedisClient):
+            def pubsub(self):
+                return pubsub
+
+        _install_fake_redis(monkeypatch, _Client())
+        watcher = RedisConfigWatcher(
+            options=RedisConfigWatcherOptions(
+                redis_url="redis://x", reconnect_delay=0, max_reconnect_attempts=2
+            )
+        )
+        await watcher.start()
+        try:
+            await _wait_until(lambda: pubsub.polls >= 10)
+            assert not watcher._watch_task.done()
+        finally:
+            await watcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_shared_client_is_cached_per_url_until_last_release(self, monkeypatch):
+        client = _FakeRedisClient()
+        _install_fake_redis(monkeypatch, client)
+        first = config_watcher._acquire_shared_redis_client("redis://x")
+        assert config_watcher._acquire_shared_redis_client("redis://x") is first
+        assert config_watcher._SHARED_CLIENTS == {"redis://x": first}
+
+        await config_watcher._release_shared_redis_client("redis://x")
+        assert config_watcher._SHARED_CLIENTS == {"redis://x": first}
+        assert client.closed is False
+        await config_watcher._release_shared_redis_client("redis://x")
+        assert config_watcher._SHARED_CLIENTS == {}
+        assert client.closed is True
+
+    @pytest.mark.asyncio
+    async def test_watcher_stop_keeps_client_held_elsewhere(self, monkeypatch):
+        client = _FakeRedisClient()
+        _install_fake_redis(monkeypatch, client)
+        other = config_watcher._acquire_shared_redis_client("redis://x")
+        watcher = RedisConfigWatcher(options=RedisConfigWatcherOptions(redis_url="redis://x"))
+        await watcher.start()
+        await watcher.stop()
+        assert config_watcher._SHARED_CLIENTS == {"redis://x": other}
+        assert client.closed is False
+
+    @pytest.mark.asyncio
+    async def test_notification_burst_coalesces_to_one_fetch(self, monkeypatch):
+        received = []
+        key = "ploston:config:native-tools"
+
+        def note(service, version):
+            data = json.dumps({"service": service, "version": version})
+            return {"type": "message", "data": data}
+
+        burst = [
+            note("native-tools", 2),
+            note("native-tools", 4),
+            note("some-other-service", 9),
+            note("native-tools", 3),
+        ]
+
+        class _Client(_FakeRedisClient):
+            gets = 0
+
+            async def get(self, key):
+                self.gets += 1
+                return await super().get(key)
+
+        client = _Client(store={key: _config_payload(1)}, pubsub_messages=burst)
+        _install_fake_redis(monkeypatch, client)
+        watcher = RedisConfigWatcher(
+            options=RedisConfigWatcherOptions(redis_url="redis://x"),
+            on_config_change=lambda c: received.append(c),
+        )
+        await watcher.start()
+        try:
+            # The store lags the newest notification, so a per-message loop
+            # would fetch again for version 4.
+            client._store[key] = _config_payload(3, base_url="http://fc:3")
+            await _wait_until(lambda: len(received) == 2)
+            # Initial fetch + a single fetch for the whole burst.
+            assert client.gets == 2
+            assert received[-1].firecrawl.base_url == "http://fc:3"
+        finally:
+            await watcher.stop()
+
     @pytest.mark.asyncio
     async def test_health_status_reports_version_and_connection(self, monkeypatch):
         key = "ploston:config:native-tools"
@@ -353,12 +738,27 @@ class TestRedisConfigWatcher:
         finally:
             await watcher.stop()
 
+    def test_connected_health_status_cached_until_version_changes(self):
+        watcher = RedisConfigWatcher(options=RedisConfigWatcherOptions(redis_url="redis://x"))
+        watcher._mark_online()
+        first = watcher.get_health_status()
+        assert watcher.get_health_status() is first
+
+        watcher._last_version = 3
+        status = watcher.get_health_status()
+        assert status is not first
+        assert status["config_version"] == 3
+
+        watcher._mark_offline()
+        assert watcher.get_health_status()["redis_connected"] is False
+
     def test_health_status_offline_message(self):
         watcher = RedisConfigWatcher(options=RedisConfigWatcherOptions(redis_url="redis://x"))
         from datetime import datetime, timedelta, timezone
 
         watcher._connected = False
         watcher._offline_since = datetime.now(timezone.utc) - timedelta(seconds=10)
+        watcher._offline_since_mono = time.monotonic() - 10
         status = watcher.get_health_status()
         assert status["redis_connected"] is False
         assert "offline_message" in status
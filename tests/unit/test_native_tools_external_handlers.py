@@ -12,6 +12,8 @@ from __future__ import annotations
 
 import sys
 import types
+from collections import OrderedDict
+from dataclasses import replace
 from typing import Any
 
 import pytest
@@ -114,7 +116,8 @@ def fake_httpx(monkeypatch):
     import ploston_core.native_tools.firecrawl as fc
 
     monkeypatch.setattr(fc, "httpx", fake)
-    # reset shared state
+    # reset shared state, including ML results cached by earlier tests
+    monkeypatch.setattr(srv, "_ML_CACHE", OrderedDict())
     _FakeAsyncClient.last_request = {}
     _FakeAsyncClient.response = _FakeResponse(json_data={"ok": True}, text="{}")
     return _FakeAsyncClient
@@ -195,6 +198,27 @@ class TestMlOllamaBacked:
         assert req["json"]["model"] == "custom-model"
         assert req["json"]["prompt"] == "hello"
 
+    @pytest.mark.asyncio
+    async def test_embed_text_repeats_served_from_cache(self, fake_httpx):
+        fake_httpx.response = _FakeResponse(status_code=500, text="down")
+        assert (await srv.ml_embed_text("again"))["success"] is False
+
+        # Failures are not cached, so the next call reaches Ollama.
+        fake_httpx.response = _FakeResponse(status_code=200, json_data={"embedding": [1.0]})
+        first = await srv.ml_embed_text("again")
+        assert first["embedding"] == [1.0]
+
+        fake_httpx.response = _FakeResponse(status_code=200, json_data={"embedding": [2.0]})
+        fake_httpx.last_request = {}
+        hit = await srv.ml_embed_text("again")
+        assert hit["embedding"] == [1.0]
+        assert fake_httpx.last_request == {}
+
+        # Mutating a returned result does not leak into later hits.
+        first["embedding"].append(9.0)
+        hit["embedding"][0] = 0.0
+        assert (await srv.ml_embed_text("again"))["embedding"] == [1.0]
+
     @pytest.mark.asyncio
     async def test_embed_text_empty_input_error(self, fake_httpx):
         result = await srv.ml_embed_text("")
@@ -257,8 +281,15 @@ class TestMlLocalMethods:
 class TestFirecrawl:
     @pytest.mark.asyncio
     async def test_search_shapes_request_and_envelope(self, fake_httpx, monkeypatch):
-        monkeypatch.setattr(srv, "FIRECRAWL_BASE_URL", "http://fc:3002")
-        monkeypatch.setattr(srv, "FIRECRAWL_API_KEY", "secret-key")
+        monkeypatch.setattr(
+            srv,
+            "_CURRENT_CFG",
+            replace(
+                srv._CURRENT_CFG,
+                firecrawl_base_url="http://fc:3002",
+                firecrawl_api_key="secret-key",
+            ),
+        )
         fake_httpx.response = _FakeResponse(
             status_code=200,
             json_data={"success": True, "data": [{"url": "https://a"}, {"url": "https://b"}]},
@@ -275,8 +306,11 @@ class TestFirecrawl:
 
     @pytest.mark.asyncio
     async def test_map_filters_excluded_and_returns_urls(self, fake_httpx, monkeypatch):
-        monkeypatch.setattr(srv, "FIRECRAWL_BASE_URL", "http://fc:3002")
-        monkeypatch.setattr(srv, "FIRECRAWL_API_KEY", None)
+        monkeypatch.setattr(
+            srv,
+            "_CURRENT_CFG",
+            replace(srv._CURRENT_CFG, firecrawl_base_url="http://fc:3002", firecrawl_api_key=None),
+        )
         fake_httpx.response = _FakeResponse(
             status_code=200,
             json_data={
@@ -294,8 +328,11 @@ class TestFirecrawl:
 
     @pytest.mark.asyncio
     async def test_extract_passes_schema_and_prompt(self, fake_httpx, monkeypatch):
-        monkeypatch.setattr(srv, "FIRECRAWL_BASE_URL", "http://fc:3002")
-        monkeypatch.setattr(srv, "FIRECRAWL_API_KEY", None)
+        monkeypatch.setattr(
+            srv,
+            "_CURRENT_CFG",
+            replace(srv._CURRENT_CFG, firecrawl_base_url="http://fc:3002", firecrawl_api_key=None),
+        )
         fake_httpx.response = _FakeResponse(
             status_code=200,
             json_data={"success": True, "data": {"title": "T"}},
@@ -314,7 +351,9 @@ class TestFirecrawl:
 
     @pytest.mark.asyncio
     async def test_health_reports_healthy(self, fake_httpx, monkeypatch):
-        monkeypatch.setattr(srv, "FIRECRAWL_BASE_URL", "http://fc:3002")
+        monkeypatch.setattr(
+            srv, "_CURRENT_CFG", replace(srv._CURRENT_CFG, firecrawl_base_url="http://fc:3002")
+        )
         fake_httpx.response = _FakeResponse(status_code=200, text="ok")
         result = await srv.firecrawl_health()
         assert result["success"] is True
@@ -397,8 +436,13 @@ def fake_kafka(monkeypatch):
 class TestKafka:
     @pytest.mark.asyncio
     async def test_publish_wires_config_and_returns_metadata(self, fake_kafka, monkeypatch):
-        monkeypatch.setattr(srv, "KAFKA_BOOTSTRAP_SERVERS", "broker:9092")
-        monkeypatch.setattr(srv, "KAFKA_CLIENT_ID", "cid")
+        # Publish through the config-change callback, which also rebuilds the
+        # Kafka connection arguments; monkeypatch restores both afterwards.
+        monkeypatch.setattr(srv, "_CURRENT_CFG", srv._CURRENT_CFG)
+        monkeypatch.setattr(srv, "_KAFKA_KWARGS", srv._KAFKA_KWARGS)
+        srv._update_config_globals(
+            replace(srv._CURRENT_CFG, kafka_bootstrap_servers="broker:9092", kafka_client_id="cid")
+        )
         result = await srv.kafka_publish("events", {"x": 1}, key="k1")
         assert result["success"] is True
         assert result["topic"] == "events"
@@ -16,18 +16,19 @@ integration/test_security.py) and is intentionally NOT duplicated here.
 from __future__ import annotations
 
 import tempfile
+from dataclasses import replace
 
 import pytest
 
 from ploston.native_tools import server as srv
 
 
-# Every fs handler reads the module global WORKSPACE_DIR at call time, so a
+# Every fs handler reads workspace_dir off srv._CURRENT_CFG at call time, so a
 # fixture that points it at a throwaway temp dir gives us a clean sandbox.
 @pytest.fixture()
 def workspace(monkeypatch):
     with tempfile.TemporaryDirectory() as td:
-        monkeypatch.setattr(srv, "WORKSPACE_DIR", td)
+        monkeypatch.setattr(srv, "_CURRENT_CFG", replace(srv._CURRENT_CFG, workspace_dir=td))
         yield td
 
 
@@ -185,63 +186,71 @@ class TestExtractFileMetadata:
 
 
 async def _write(srv_mod, path, content, **kw):
-    """fs_write is sync; call it directly (handler is not a coroutine)."""
-    return srv_mod.fs_write(path, content, **kw)
+    """Write a fixture file through the real fs_write handler."""
+    return await srv_mod.fs_write(path, content, **kw)
 
 
 class TestFilesystem:
-    def test_write_then_read_text(self, workspace):
-        wrote = srv.fs_write("sub/a.txt", "hello")
+    @pytest.mark.asyncio
+    async def test_write_then_read_text(self, workspace):
+        wrote = await srv.fs_write("sub/a.txt", "hello")
         assert wrote["created"] is True
         assert wrote["size"] == 5
 
-        read = srv.fs_read("sub/a.txt")
+        read = await srv.fs_read("sub/a.txt")
         assert read["content"] == "hello"
         assert read["format"] == "text"
 
-    def test_write_then_read_json(self, workspace):
-        srv.fs_write("d.json", {"k": 1}, format="json")
-        read = srv.fs_read("d.json", format="json")
+    @pytest.mark.asyncio
+    async def test_write_then_read_json(self, workspace):
+        await srv.fs_write("d.json", {"k": 1}, format="json")
+        read = await srv.fs_read("d.json", format="json")
         assert read["content"] == {"k": 1}
 
-    def test_list_recursive_reports_files_and_dirs(self, workspace):
-        srv.fs_write("sub/a.txt", "x")
-        srv.fs_write("sub/b.txt", "y")
-        listing = srv.fs_list(".", recursive=True)
+    @pytest.mark.asyncio
+    async def test_list_recursive_reports_files_and_dirs(self, workspace):
+        await srv.fs_write("sub/a.txt", "x")
+        await srv.fs_write("sub/b.txt", "y")
+        listing = await srv.fs_list(".", recursive=True)
         names = {item["name"] for item in listing["items"]}
         assert "a.txt" in names
         assert "b.txt" in names
         assert listing["total_files"] == 2
         assert listing["total_dirs"] == 1
 
-    def test_list_with_pattern_filter(self, workspace):
-        srv.fs_write("keep.log", "x")
-        srv.fs_write("skip.txt", "y")
-        listing = srv.fs_list(".", pattern="*.log")
+    @pytest.mark.asyncio
+    async def test_list_with_pattern_filter(self, workspace):
+        await srv.fs_write("keep.log", "x")
+        await srv.fs_write("skip.txt", "y")
+        listing = await srv.fs_list(".", pattern="*.log")
         names = {item["name"] for item in listing["items"]}
         assert "keep.log" in names
         assert "skip.txt" not in names
 
-    def test_read_missing_file_raises(self, workspace):
+    @pytest.mark.asyncio
+    async def test_read_missing_file_raises(self, workspace):
         with pytest.raises(FileNotFoundError):
-            srv.fs_read("ghost.txt")
+            await srv.fs_read("ghost.txt")
 
-    def test_delete_file(self, workspace):
-        srv.fs_write("temp.txt", "x")
-        result = srv.fs_delete("temp.txt")
+    @pytest.mark.asyncio
+    async def test_delete_file(self, workspace):
+        await srv.fs_write("temp.txt", "x")
+        result = await srv.fs_delete("temp.txt")
         assert result["deleted"] is True
         with pytest.raises(FileNotFoundError):
-            srv.fs_read("temp.txt")
+            await srv.fs_read("temp.txt")
 
-    def test_delete_missing_raises(self, workspace):
+    @pytest.mark.asyncio
+    async def test_delete_missing_raises(self, workspace):
         with pytest.raises(FileNotFoundError):
-            srv.fs_delete("ghost.txt")
+            await srv.fs_delete("ghost.txt")
 
-    def test_delete_nonempty_dir_requires_recursive(self, workspace):
-        srv.fs_write("d2/x.txt", "x")
+    @pytest.mark.asyncio
+    async def test_delete_nonempty_dir_requires_recursive(self, workspace):
+        await srv.fs_write("d2/x.txt", "x")
         with pytest.raises(ValueError):
-            srv.fs_delete("d2")
-        result = srv.fs_delete("d2", recursive=True)
+            await srv.fs_delete("d2")
+        result = await srv.fs_delete("d2", recursive=True)
         assert result["deleted"] is True
         assert result["type"] == "directory"
 
@@ -282,6 +291,22 @@ class TestNetworkPortCheck:
             server.close()
             await server.wait_closed()
 
+    @pytest.mark.asyncio
+    async def test_port_check_many_keeps_port_order(self):
+        import asyncio
+
+        server = await asyncio.start_server(lambda r, w: w.close(), "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            result = await srv.network_port_check_many("127.0.0.1", [1, port], timeout=2)
+            assert result["success"] is True
+            assert result["count"] == 2
+            assert [r["port"] for r in result["results"]] == [1, port]
+            assert [r["is_open"] for r in result["results"]] == [False, True]
+        finally:
+            server.close()
+            await server.wait_closed()
+
 
 class TestNetworkDnsLookup:
     @pytest.mark.asyncio
@@ -13,8 +13,10 @@ don't leak dependency state into the rest of the suite.
 
 from __future__ import annotations
 
+import logging
 import sys
 import types
+from dataclasses import replace
 
 import pytest
 from ploston_core.native_tools import (
@@ -208,27 +210,10 @@ class TestConfigGlobalsWiring:
     def test_update_config_globals_rebinds_module_state(self, monkeypatch):
         from ploston.native_tools.config_manager import ToolConfig
 
-        # Snapshot + restore the module globals this function rebinds, so it
+        # monkeypatch restores the globals this function rebinds, so they
         # cannot leak into other tests sharing this interpreter.
-        names = [
-            "WORKSPACE_DIR",
-            "MAX_FILE_SIZE",
-            "ALLOWED_PATHS",
-            "DENIED_PATHS",
-            "ALLOWED_HOSTS",
-            "DENIED_HOSTS",
-            "FIRECRAWL_BASE_URL",
-            "FIRECRAWL_API_KEY",
-            "KAFKA_BOOTSTRAP_SERVERS",
-            "KAFKA_CLIENT_ID",
-            "KAFKA_SECURITY_PROTOCOL",
-            "KAFKA_SASL_MECHANISM",
-            "KAFKA_SASL_USERNAME",
-            "KAFKA_SASL_PASSWORD",
-            "OLLAMA_HOST",
-            "DEFAULT_EMBEDDING_MODEL",
-        ]
-        saved = {n: getattr(srv, n) for n in names}
+        monkeypatch.setattr(srv, "_CURRENT_CFG", srv._CURRENT_CFG)
+        monkeypatch.setattr(srv, "_KAFKA_KWARGS", srv._KAFKA_KWARGS)
 
         new = ToolConfig(
             workspace_dir="/ws2",
@@ -242,29 +227,60 @@ class TestConfigGlobalsWiring:
             ollama_host="http://oll:1",
             default_embedding_model="m1",
         )
-        try:
-            srv._update_config_globals(new)
-            # The handlers read these module globals at call time.
-            assert srv.WORKSPACE_DIR == "/ws2"
-            assert srv.MAX_FILE_SIZE == 4242
-            assert srv.ALLOWED_PATHS == ["/ws2/pub"]
-            assert srv.DENIED_HOSTS == ["evil.example.com"]
-            assert srv.FIRECRAWL_BASE_URL == "http://fc:9"
-            assert srv.KAFKA_BOOTSTRAP_SERVERS == "broker:9092"
-            assert srv.OLLAMA_HOST == "http://oll:1"
-            assert srv.DEFAULT_EMBEDDING_MODEL == "m1"
-        finally:
-            for n, v in saved.items():
-                setattr(srv, n, v)
+        srv._update_config_globals(new)
+        # The handlers read this object at call time.
+        assert srv._CURRENT_CFG is new
+        assert srv._CURRENT_CFG.workspace_dir == "/ws2"
+        assert srv._CURRENT_CFG.max_file_size == 4242
+        assert srv._KAFKA_KWARGS["bootstrap_servers"] == "broker:9092"
+
+    def test_kafka_kwargs_omit_sasl_for_plaintext(self):
+        base = replace(
+            srv._CURRENT_CFG,
+            kafka_sasl_mechanism="PLAIN",
+            kafka_sasl_username="u",
+            kafka_sasl_password="p",
+        )
+        plain = srv._kafka_kwargs(replace(base, kafka_security_protocol="PLAINTEXT"))
+        assert not any(k.startswith("sasl_") for k in plain)
+
+        sasl = srv._kafka_kwargs(replace(base, kafka_security_protocol="SASL_SSL"))
+        assert sasl["sasl_mechanism"] == "PLAIN"
+        assert sasl["sasl_username"] == "u"
+        assert sasl["sasl_password"] == "p"
+
+    def test_logging_configuration_is_idempotent(self):
+        before = list(logging.getLogger().handlers)
+        assert srv._configure_logging() is srv.stderr_handler
+        assert logging.getLogger().handlers == before
+
+    def test_startup_config_logged_only_in_docker(self, monkeypatch, capsys):
+        monkeypatch.setattr(srv, "_in_docker", lambda: False)
+        srv._log_startup_config()
+        assert capsys.readouterr().err == ""
+
+        monkeypatch.setattr(srv, "_in_docker", lambda: True)
+        monkeypatch.setattr(
+            srv, "_CURRENT_CFG", replace(srv._CURRENT_CFG, ollama_host="http://o:1")
+        )
+        srv._log_startup_config()
+        assert "[Docker] OLLAMA_HOST: http://o:1" in capsys.readouterr().err
 
     def test_configure_health_manager_registers_dependencies(
         self, clean_health_manager, monkeypatch
     ):
-        # Point the module globals at non-default endpoints so the health
+        # Point the current config at non-default endpoints so the health
         # manager treats the dependencies as enabled.
-        monkeypatch.setattr(srv, "KAFKA_BOOTSTRAP_SERVERS", "broker:9092")
-        monkeypatch.setattr(srv, "OLLAMA_HOST", "http://ollama:11434")
-        monkeypatch.setattr(srv, "FIRECRAWL_BASE_URL", "http://fc:3002")
+        monkeypatch.setattr(
+            srv,
+            "_CURRENT_CFG",
+            replace(
+                srv._CURRENT_CFG,
+                kafka_bootstrap_servers="broker:9092",
+                ollama_host="http://ollama:11434",
+                firecrawl_base_url="http://fc:3002",
+            ),
+        )
         srv._configure_health_manager()
         assert clean_health_manager.is_dependency_enabled("kafka") is True
         assert clean_health_manager.is_dependency_enabled("ollama") is True
@@ -11,7 +11,9 @@ exercised here.
 
 from __future__ import annotations
 
+import asyncio
 import sys
+import types
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -171,3 +173,27 @@ def test_main_handles_keyboard_interrupt(monkeypatch: pytest.MonkeyPatch) -> Non
         server.main()
 
     shutdown.assert_awaited_once()
+
+
+def test_main_runs_on_uvloop_when_installed(monkeypatch: pytest.MonkeyPatch) -> None:
+    """main() hands the server coroutine to uvloop.run when uvloop is importable."""
+    monkeypatch.setattr(sys, "argv", ["ploston-server"])
+
+    ran: list[object] = []
+    fake_uvloop = types.ModuleType("uvloop")
+    fake_uvloop.run = lambda coro: ran.append(asyncio.run(coro))  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "uvloop", fake_uvloop)
+
+    class FakeApp:
+        def __init__(self, **kwargs: object) -> None:
+            self.initialize = AsyncMock()
+            self.start = AsyncMock()
+            self.shutdown = AsyncMock()
+
+    with (
+        patch("ploston.server.PlostApplication", FakeApp),
+        patch("ploston.server.FeatureFlagRegistry"),
+    ):
+        server.main()
+
+    assert ran == [None]